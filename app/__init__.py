@@ -9,15 +9,51 @@ This package provides a modular Flask application demonstrating:
 - Swagger/OpenAPI documentation
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 
-from app.config import Config
+from app.config import Config, get_config
 from app.extensions import init_extensions
 from app.telemetry import configure_logging, configure_opentelemetry
 
+if TYPE_CHECKING:
+    from flask.wrappers import Response
+
 __all__ = ["create_app", "Config"]
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson.
+
+    Every endpoint serializes its response through the app's JSON
+    provider; orjson does that in C and skips stdlib json's ensure_ascii
+    escaping pass. self.default still handles the types DefaultJSONProvider
+    covers beyond orjson's natives (e.g. Decimal, Markup).
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand bytes straight to the response instead of routing through
+        # dumps() + decode() + Werkzeug's re-encode. _app is typed as the
+        # sansio App, whose response_class loses the Flask Response type.
+        obj = self._prepare_response_obj(args, kwargs)
+        response_class = cast("type[Response]", self._app.response_class)
+        return response_class(
+            orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE, default=self.default),
+            mimetype="application/json",
+        )
+
+
 def create_app(config: Config | None = None) -> Flask:
     """Application factory for creating Flask app instances.
 
@@ -29,7 +65,7 @@ def create_app(config: Config | None = None) -> Flask:
         Configured Flask application instance.
     """
     if config is None:
-        config = Config.from_env()
+        config = get_config()
 
     # Configure OpenTelemetry before creating app
     tracer = configure_opentelemetry(config)
@@ -37,6 +73,7 @@ def create_app(config: Config | None = None) -> Flask:
 
     # Create Flask app
     flask_app = Flask(__name__)
+    flask_app.json = OrjsonProvider(flask_app)
     flask_app.config["APP_CONFIG"] = config
     flask_app.config["TRACER"] = tracer
 
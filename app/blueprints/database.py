@@ -7,10 +7,15 @@ the owntracks locations table.
 
 import logging
 
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request
 from opentelemetry import trace
 
-from app.services.database import DatabaseService, get_db_service, init_db_service
+from app.services.database import (
+    DatabaseService,
+    get_db_service,
+    init_db_service,
+    serialize_locations_response,
+)
 
 database_bp = Blueprint("database", __name__, url_prefix="/db")
 logger = logging.getLogger(__name__)
@@ -243,17 +248,18 @@ def db_locations():
             span.set_attribute("db.result_count", len(locations))
             logger.info(f"Retrieved {len(locations)} location records")
 
-            return jsonify(
+            body = serialize_locations_response(
                 {
                     "count": len(locations),
                     "limit": limit,
                     "offset": offset,
                     "sort": sort,
                     "order": order.lower(),
-                    "locations": [loc.to_dict() for loc in locations],
+                    "locations": locations,
                     "trace_id": format(span.get_span_context().trace_id, "032x"),
                 }
             )
+            return Response(body, mimetype="application/json")
 
         except Exception as e:
             span.record_exception(e)
@@ -7,7 +7,8 @@ from home location. Supports async job management with polling and CSV downloads
 
 import logging
 import os
-from datetime import datetime
+import re
+from datetime import date, datetime
 
 import requests
 from flask import Blueprint, Response, current_app, jsonify, request
@@ -25,6 +26,29 @@ from app.services.distance_client import (
 distance_bp = Blueprint("distance", __name__, url_prefix="/api/distance")
 logger = logging.getLogger(__name__)
 
+# fullmatch with no trailing anchor: "$" would also match before a
+# trailing newline, letting "2026-01-25\n" through where strptime
+# rejected it. re.ASCII keeps \d to [0-9]; bare \d matches any Unicode
+# decimal digit, which int() would happily parse while the raw string
+# is forwarded to the worker unvalidated.
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+
+
+def _parse_request_date(value: str) -> date:
+    """Parse a YYYY-MM-DD string into a date.
+
+    strptime walks its format string on every call; a precompiled regex
+    plus the date() constructor is several times faster on this
+    per-request validation path. Raises ValueError for malformed or
+    impossible dates, same as strptime.
+    """
+    match = _DATE_RE.fullmatch(value)
+    if not match:
+        raise ValueError(f"invalid date: {value!r}")
+    year, month, day = match.groups()
+    return date(int(year), int(month), int(day))
+
+
 # Initialize requests instrumentation for trace context propagation
 RequestsInstrumentor().instrument()
 
@@ -170,9 +194,9 @@ def calculate_distance():
 
         # Validate date format
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = _parse_request_date(date)
             # Check if date is not in future
-            if date_obj.date() > datetime.now().date():
+            if date_obj > datetime.now().date():
                 return error_response(
                     "Date cannot be in the future", "VALIDATION_ERROR", trace_id, 400
                 )
@@ -503,7 +527,7 @@ def list_jobs():
         # Validate date format if provided
         if date:
             try:
-                datetime.strptime(date, "%Y-%m-%d")
+                _parse_request_date(date)
             except ValueError:
                 return error_response(
                     "Invalid date format. Expected YYYY-MM-DD",
@@ -662,11 +686,35 @@ def download_csv(filename: str):
 
         span.set_attribute("distance.service_timeout", timeout_seconds)
 
+        # Forward conditional-request headers so dashboards polling an
+        # unchanged CSV get a body-less 304 straight from the worker.
+        conditional_headers = {}
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            conditional_headers["If-None-Match"] = if_none_match
+        if_modified_since = request.headers.get("If-Modified-Since")
+        if if_modified_since:
+            conditional_headers["If-Modified-Since"] = if_modified_since
+
         response = None
         try:
             # Proxy request to otel-worker with streaming
             # RequestsInstrumentor automatically propagates trace context
-            response = requests.get(worker_url, timeout=timeout_seconds, stream=True)
+            response = requests.get(
+                worker_url,
+                timeout=timeout_seconds,
+                stream=True,
+                headers=conditional_headers or None,
+            )
+
+            if response.status_code == 304:  # noqa: PLR2004
+                not_modified = Response(status=304, mimetype="text/csv")
+                for header in ("ETag", "Last-Modified"):
+                    if header in response.headers:
+                        not_modified.headers[header] = response.headers[header]
+                response.close()
+                span.set_attribute("distance.proxy_status", "not_modified")
+                return not_modified
 
             if response.status_code == 404:  # noqa: PLR2004
                 logger.warning(f"CSV file not found on worker: {filename}")
@@ -699,6 +747,10 @@ def download_csv(filename: str):
             flask_response.headers["Content-Disposition"] = (
                 f'attachment; filename="{safe_filename}"'
             )
+            # Pass validators through so clients can revalidate next time
+            for header in ("ETag", "Last-Modified"):
+                if header in response.headers:
+                    flask_response.headers[header] = response.headers[header]
 
             logger.info(f"Successfully proxied CSV download: {filename}")
             span.set_attribute("distance.proxy_status", "success")
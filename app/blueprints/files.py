@@ -5,9 +5,10 @@ Provides endpoints for listing, reading, writing, and deleting
 files within the configured data directory.
 """
 
+import json
 import logging
 
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request
 from opentelemetry import trace
 
 from app.services.storage import (
@@ -22,6 +23,20 @@ from app.services.storage import (
 files_bp = Blueprint("files", __name__, url_prefix="/files")
 logger = logging.getLogger(__name__)
 
+# Pre-rendered JSON templates for the constant error bodies. Only the path
+# varies, so a byte-level substitution replaces the dict + jsonify round
+# trip on these hot error paths (path-traversal scanners and misbehaving
+# clients hit them far more often than legitimate requests do).
+_INVALID_PATH_TMPL = b'{"error": "Invalid path", "path": %b}'
+_NOT_FOUND_TMPL = b'{"error": "Path not found", "path": %b}'
+_DIR_NOT_EMPTY_TMPL = b'{"error": "Directory not empty", "path": %b}'
+
+
+def _error_response(template: bytes, filepath: str, status: int) -> Response:
+    """Render a prebuilt error template with the offending path."""
+    body = template % json.dumps(filepath).encode()
+    return Response(body, status=status, mimetype="application/json")
+
 
 def get_tracer() -> trace.Tracer:
     """Get the tracer from the current app context."""
@@ -100,16 +115,24 @@ def get_files(filepath: str = ""):
     """
     tracer = get_tracer()
     with tracer.start_as_current_span("files-get") as span:
-        span.set_attribute("file.path", filepath or "/")
+        # Skip attribute decoration entirely when the span was not sampled
+        recording = span.is_recording()
+        if recording:
+            span.set_attribute("file.path", filepath or "/")
 
         try:
             storage = _get_or_init_storage_service()
             trace_id = format(span.get_span_context().trace_id, "032x")
 
-            if storage.is_directory(filepath):
-                span.set_attribute("file.type", "directory")
+            # One stat classifies the path; is_directory + read_file's
+            # own existence probes would stat it all over again.
+            kind, _ = storage.probe(filepath)
+
+            if kind == "directory":
                 items = storage.list_directory(filepath)
-                span.set_attribute("file.item_count", len(items))
+                if recording:
+                    span.set_attribute("file.type", "directory")
+                    span.set_attribute("file.item_count", len(items))
 
                 return jsonify(
                     {
@@ -120,9 +143,10 @@ def get_files(filepath: str = ""):
                     }
                 )
             else:
-                span.set_attribute("file.type", "file")
                 content, size = storage.read_file(filepath)
-                span.set_attribute("file.size", size)
+                if recording:
+                    span.set_attribute("file.type", "file")
+                    span.set_attribute("file.size", size)
 
                 return jsonify(
                     {
@@ -136,11 +160,11 @@ def get_files(filepath: str = ""):
 
         except InvalidPathError:
             span.set_status(trace.Status(trace.StatusCode.ERROR, "Invalid path"))
-            return jsonify({"error": "Invalid path", "path": filepath}), 400
+            return _error_response(_INVALID_PATH_TMPL, filepath, 400)
 
         except PathNotFoundError:
             span.set_status(trace.Status(trace.StatusCode.ERROR, "Not found"))
-            return jsonify({"error": "Path not found", "path": filepath}), 404
+            return _error_response(_NOT_FOUND_TMPL, filepath, 404)
 
 
 @files_bp.route("/<path:filepath>", methods=["POST", "PUT"])
@@ -203,7 +227,9 @@ def write_file(filepath: str):
     """
     tracer = get_tracer()
     with tracer.start_as_current_span("files-write") as span:
-        span.set_attribute("file.path", filepath)
+        recording = span.is_recording()
+        if recording:
+            span.set_attribute("file.path", filepath)
 
         try:
             storage = _get_or_init_storage_service()
@@ -220,8 +246,9 @@ def write_file(filepath: str):
                 content = request.get_data(as_text=True)
 
             status, size = storage.write_file(filepath, content)
-            span.set_attribute("file.size", size)
-            span.set_attribute("file.created", status == "created")
+            if recording:
+                span.set_attribute("file.size", size)
+                span.set_attribute("file.created", status == "created")
 
             status_code = 201 if status == "created" else 200
 
@@ -236,7 +263,7 @@ def write_file(filepath: str):
 
         except InvalidPathError:
             span.set_status(trace.Status(trace.StatusCode.ERROR, "Invalid path"))
-            return jsonify({"error": "Invalid path", "path": filepath}), 400
+            return _error_response(_INVALID_PATH_TMPL, filepath, 400)
 
 
 @files_bp.route("/<path:filepath>", methods=["DELETE"])
@@ -278,12 +305,15 @@ def delete_file(filepath: str):
     """
     tracer = get_tracer()
     with tracer.start_as_current_span("files-delete") as span:
-        span.set_attribute("file.path", filepath)
+        recording = span.is_recording()
+        if recording:
+            span.set_attribute("file.path", filepath)
 
         try:
             storage = _get_or_init_storage_service()
             file_type = storage.delete(filepath)
-            span.set_attribute("file.type", file_type)
+            if recording:
+                span.set_attribute("file.type", file_type)
 
             return jsonify(
                 {
@@ -296,15 +326,15 @@ def delete_file(filepath: str):
 
         except InvalidPathError:
             span.set_status(trace.Status(trace.StatusCode.ERROR, "Invalid path"))
-            return jsonify({"error": "Invalid path", "path": filepath}), 400
+            return _error_response(_INVALID_PATH_TMPL, filepath, 400)
 
         except PathNotFoundError:
             span.set_status(trace.Status(trace.StatusCode.ERROR, "Not found"))
-            return jsonify({"error": "Path not found", "path": filepath}), 404
+            return _error_response(_NOT_FOUND_TMPL, filepath, 404)
 
         except DirectoryNotEmptyError:
             span.set_status(trace.Status(trace.StatusCode.ERROR, "Not empty"))
-            return jsonify({"error": "Directory not empty", "path": filepath}), 400
+            return _error_response(_DIR_NOT_EMPTY_TMPL, filepath, 400)
 
 
 @files_bp.route("", methods=["POST"])
@@ -361,7 +391,8 @@ def create_directory():
             span.set_status(trace.Status(trace.StatusCode.ERROR, "No path"))
             return jsonify({"error": "Path is required"}), 400
 
-        span.set_attribute("file.path", dirpath)
+        if span.is_recording():
+            span.set_attribute("file.path", dirpath)
 
         try:
             storage = _get_or_init_storage_service()
@@ -8,9 +8,19 @@ and validation for all application settings.
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Splits comma-separated env values, consuming surrounding whitespace in the
+# same pass instead of a per-item strip().
+_CSV_SEP = re.compile(r"\s*,\s*")
+
+
+def _split_csv(value: str) -> tuple[str, ...]:
+    """Split a comma-separated env value into a tuple, dropping empty items."""
+    return tuple(item for item in _CSV_SEP.split(value.strip()) if item)
+
 
 @dataclass(frozen=True)
 class Config:
@@ -25,6 +35,7 @@ class Config:
         service_name: Service name for traces (default: otel-demo)
         service_namespace: Service namespace (default: otel-demo)
         environment: Deployment environment (default: homelab)
+        trace_sample_ratio: Head-sampling ratio for root spans (default: 1.0)
 
         # Application metadata
         app_version: Application version (default: 1.0.0)
@@ -42,6 +53,7 @@ class Config:
         db_connect_timeout: Connection timeout in seconds (default: 5)
 
         # Swagger settings
+        swagger_enabled: Whether to mount Swagger UI and spec routes (default: True)
         swagger_host: Override host for Swagger UI (default: "")
         swagger_schemes: URL schemes for Swagger (default: ["http"])
     """
@@ -56,6 +68,8 @@ class Config:
     service_namespace: str = "otel-demo"
     environment: str = "homelab"
 
+    trace_sample_ratio: float = 1.0
+
     # Application metadata
     app_version: str = "1.0.0"
     build_number: str = "0"
@@ -76,6 +90,7 @@ class Config:
     distance_service_timeout: int = 30
 
     # Swagger settings
+    swagger_enabled: bool = True
     swagger_host: str = ""
     swagger_schemes: tuple[str, ...] = ("http",)
 
@@ -107,12 +122,10 @@ class Config:
             ) from exc
 
         # Parse schemes as tuple
-        schemes_str = os.getenv("SWAGGER_SCHEMES", "http")
-        swagger_schemes = tuple(s.strip() for s in schemes_str.split(","))
+        swagger_schemes = _split_csv(os.getenv("SWAGGER_SCHEMES", "http"))
 
         # Parse CORS origins as tuple
-        cors_origins_str = os.getenv("CORS_ORIGINS", "")
-        cors_origins = tuple(s.strip() for s in cors_origins_str.split(",") if s.strip())
+        cors_origins = _split_csv(os.getenv("CORS_ORIGINS", ""))
 
         # Parse PORT with validation
         port_env = os.getenv("PORT", "8080")
@@ -147,6 +160,16 @@ class Config:
                 f"Invalid DB_CONNECT_TIMEOUT value: {db_connect_timeout_str!r}. Must be an integer."
             ) from exc
 
+        # Parse sampling ratio (standard OTel env var) with validation
+        sample_ratio_str = os.getenv("OTEL_TRACES_SAMPLER_ARG", "1.0")
+        try:
+            trace_sample_ratio = float(sample_ratio_str)
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid OTEL_TRACES_SAMPLER_ARG value: {sample_ratio_str!r}. "
+                "Must be a float between 0 and 1."
+            ) from exc
+
         return cls(
             # Server
             port=port,
@@ -156,6 +179,7 @@ class Config:
             service_name=os.getenv("OTEL_SERVICE_NAME", "otel-demo"),
             service_namespace=os.getenv("OTEL_SERVICE_NAMESPACE", "otel-demo"),
             environment=os.getenv("OTEL_ENVIRONMENT", "homelab"),
+            trace_sample_ratio=trace_sample_ratio,
             # App metadata
             app_version=os.getenv("APP_VERSION", "1.0.0"),
             build_number=os.getenv("BUILD_NUMBER", "0"),
@@ -173,6 +197,7 @@ class Config:
             distance_service_endpoint=os.getenv("DISTANCE_SERVICE_ENDPOINT", "localhost:50051"),
             distance_service_timeout=int(os.getenv("DISTANCE_SERVICE_TIMEOUT", "30")),
             # Swagger
+            swagger_enabled=os.getenv("SWAGGER_ENABLED", "true").lower() != "false",
             swagger_host=os.getenv("SWAGGER_HOST", ""),
             swagger_schemes=swagger_schemes,
             # OAuth2/Cognito
@@ -207,3 +232,25 @@ class Config:
                 "Set COGNITO_DOMAIN and COGNITO_CLIENT_ID environment variables, "
                 "or disable OAuth2 by setting OAUTH2_ENABLED=false."
             )
+
+
+# Process-wide configuration, parsed from the environment once per process.
+# No lock: Config is frozen and from_env is pure, so a racing first call
+# simply produces an equal instance.
+_config: Config | None = None
+
+
+def get_config() -> Config:
+    """Get the cached process-wide configuration.
+
+    Parses environment variables on first call and returns the same
+    frozen Config instance afterwards, so per-request (or per-test)
+    callers never re-read the environment.
+
+    Returns:
+        The cached Config instance.
+    """
+    global _config
+    if _config is None:
+        _config = Config.from_env()
+    return _config
@@ -9,18 +9,76 @@ Centralizes the setup of Flask extensions including:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, cast
 
 from flasgger import Swagger
+from flask import Response
 from flask_cors import CORS
 from opentelemetry.instrumentation.flask import FlaskInstrumentor
 from prometheus_flask_exporter import PrometheusMetrics
 
 if TYPE_CHECKING:
     from flask import Flask
+    from flask.typing import ResponseReturnValue
 
     from app.config import Config
 
+# URLs with no observability value: swagger assets, the spec, and the
+# kubelet health probes. Excluding them skips span creation, context
+# propagation, and exporter queue pressure for every matching request.
+_UNTRACED_URLS = "/flasgger_static/.*,/apidocs/.*,/apispec.json,/health,/ready"
+
+
+def _include_all(item: Any) -> bool:
+    """Spec filter that includes every rule/tag (flasgger needs a callable)."""
+    return True
+
+
+# flasgger copies this into its own config dict, so sharing one instance
+# across app creations is safe; the filters are defined once instead of
+# allocating fresh lambdas per init.
+# Static template pieces shared by every app instance; only version, host,
+# schemes, and the optional OAuth2 block vary with config.
+_SWAGGER_INFO = {
+    "title": "OTel Demo API",
+    "description": "OpenTelemetry Demo App - Flask application with distributed tracing",
+    "contact": {
+        "name": "Stuart Shay",
+        "url": "https://github.com/stuartshay/otel-demo",
+    },
+    "license": {
+        "name": "MIT",
+        "url": "https://opensource.org/licenses/MIT",
+    },
+}
+
+# flasgger only reads the tags, so one shared tuple serves every app
+# instance (JSON-serializes as an array like the previous list did).
+_SWAGGER_TAGS = (
+    {"name": "Health", "description": "Health and readiness endpoints"},
+    {"name": "Demo", "description": "OpenTelemetry demonstration endpoints"},
+    {"name": "Database", "description": "PostgreSQL database operations"},
+    {"name": "Files", "description": "NFS storage file operations"},
+    {"name": "Observability", "description": "Observability configuration"},
+)
+
+_SWAGGER_CONFIG = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": "apispec",
+            "route": "/apispec.json",
+            "rule_filter": _include_all,
+            "model_filter": _include_all,
+        }
+    ],
+    "static_url_path": "/flasgger_static",
+    "swagger_ui": True,
+    "specs_route": "/apidocs/",
+}
+
 
 def init_extensions(flask_app: Flask, config: Config) -> None:
     """Initialize all Flask extensions.
@@ -33,7 +91,9 @@ def init_extensions(flask_app: Flask, config: Config) -> None:
     # This exposes /metrics/prometheus endpoint in Prometheus format
     PrometheusMetrics(flask_app, path="/metrics/prometheus")
 
-    # Configure CORS to allow frontend access
+    # Configure CORS to allow frontend access. max_age lets browsers cache
+    # the preflight response for 24h so cross-origin requests don't pay an
+    # OPTIONS round-trip each time.
     if config.cors_origins:
         CORS(
             flask_app,
@@ -41,13 +101,61 @@ def init_extensions(flask_app: Flask, config: Config) -> None:
             allow_headers=["Content-Type", "Authorization"],
             expose_headers=["X-Trace-Id"],
             supports_credentials=True,
+            max_age=86400,
         )
 
-    # Instrument Flask for tracing
-    FlaskInstrumentor().instrument_app(flask_app)
+    # Instrument Flask for tracing (after CORS so preflight handling stays
+    # ahead of span creation); skip URLs that are never worth a trace
+    FlaskInstrumentor().instrument_app(flask_app, excluded_urls=_UNTRACED_URLS)
+
+    # Initialize Swagger documentation. Workers that never serve docs can
+    # opt out entirely (SWAGGER_ENABLED=false) and skip the template build
+    # and blueprint registration at cold start; Flask requires blueprints
+    # to be registered before the first request, so this cannot be deferred
+    # to first access instead.
+    if config.swagger_enabled:
+        # swagger-ui-dist assets are versioned with flasgger, so browsers
+        # can cache them for a year instead of re-fetching dozens of
+        # CSS/JS files through Flask on every docs page load.
+        flask_app.config.setdefault("SEND_FILE_MAX_AGE_DEFAULT", timedelta(days=365))
+
+        _init_swagger(flask_app, config)
+
+        # Serve the OpenAPI spec from a cache after the first build
+        _cache_apispec(flask_app)
+
+
+def _cache_apispec(flask_app: Flask) -> None:
+    """Serve /apispec.json from pre-rendered bytes after the first request.
+
+    flasgger regenerates the spec on every request by walking the URL map
+    and re-parsing every view docstring. Routes do not change at runtime,
+    so build the spec once on first access and replay the serialized body
+    for all later requests.
 
-    # Initialize Swagger documentation
-    _init_swagger(flask_app, config)
+    Args:
+        flask_app: Flask application instance with Swagger initialized.
+    """
+    spec_view = flask_app.view_functions["flasgger.apispec"]
+    # Single-slot cache; a racing first request just rebuilds the same bytes.
+    cache: dict[str, bytes] = {}
+
+    @functools.wraps(spec_view)
+    def cached_spec_view(*args: Any, **kwargs: Any) -> Response:
+        body = cache.get("spec")
+        if body is None:
+            # view_functions values are typed as possibly-async callables;
+            # flasgger's spec view is synchronous.
+            rv = cast("ResponseReturnValue", spec_view(*args, **kwargs))
+            body = flask_app.make_response(rv).get_data()
+            cache["spec"] = body
+        return Response(
+            body,
+            mimetype="application/json",
+            headers={"Cache-Control": "public, max-age=86400"},
+        )
+
+    flask_app.view_functions["flasgger.apispec"] = cached_spec_view
 
 
 def _init_swagger(flask_app: Flask, config: Config) -> Swagger:
@@ -60,45 +168,12 @@ def _init_swagger(flask_app: Flask, config: Config) -> Swagger:
     Returns:
         Configured Swagger instance.
     """
-    swagger_config = {
-        "headers": [],
-        "specs": [
-            {
-                "endpoint": "apispec",
-                "route": "/apispec.json",
-                "rule_filter": lambda rule: True,  # noqa: ARG005
-                "model_filter": lambda tag: True,  # noqa: ARG005
-            }
-        ],
-        "static_url_path": "/flasgger_static",
-        "swagger_ui": True,
-        "specs_route": "/apidocs/",
-    }
-
     swagger_template = {
-        "info": {
-            "title": "OTel Demo API",
-            "description": "OpenTelemetry Demo App - Flask application with distributed tracing",
-            "version": config.app_version,
-            "contact": {
-                "name": "Stuart Shay",
-                "url": "https://github.com/stuartshay/otel-demo",
-            },
-            "license": {
-                "name": "MIT",
-                "url": "https://opensource.org/licenses/MIT",
-            },
-        },
+        "info": {**_SWAGGER_INFO, "version": config.app_version},
         "host": config.swagger_host,
         "basePath": "/",
         "schemes": list(config.swagger_schemes),
-        "tags": [
-            {"name": "Health", "description": "Health and readiness endpoints"},
-            {"name": "Demo", "description": "OpenTelemetry demonstration endpoints"},
-            {"name": "Database", "description": "PostgreSQL database operations"},
-            {"name": "Files", "description": "NFS storage file operations"},
-            {"name": "Observability", "description": "Observability configuration"},
-        ],
+        "tags": _SWAGGER_TAGS,
     }
 
     # Add OAuth2 security definitions if enabled
@@ -130,4 +205,4 @@ def _init_swagger(flask_app: Flask, config: Config) -> Swagger:
         # Apply security globally; individual endpoints can override (e.g., health via security=[])
         swagger_template["security"] = [{"oauth2": ["openid", "email", "profile"]}]
 
-    return Swagger(flask_app, config=swagger_config, template=swagger_template)
+    return Swagger(flask_app, config=_SWAGGER_CONFIG, template=swagger_template)
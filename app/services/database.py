@@ -10,11 +10,14 @@ from __future__ import annotations
 import logging
 import threading
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
-from psycopg2 import pool
+import orjson
+from psycopg2 import extensions, pool
 
 if TYPE_CHECKING:
     from psycopg2.extensions import connection
@@ -24,9 +27,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LocationRecord:
-    """Represents a location record from the owntracks database."""
+    """Represents a location record from the owntracks database.
+
+    Slotted to drop the per-instance __dict__: a 100-row response
+    allocates 100 of these per request, and slots roughly halve the
+    per-record footprint on CPython. Frozen because records are built
+    once from a DB row and only ever read afterwards.
+    """
 
     id: int
     device_id: str
@@ -65,6 +74,74 @@ class LocationRecord:
         }
 
 
+# Columns callers may sort by; anything else falls back to created_at,
+# which avoids unstable ordering when timestamp may be NULL.
+_ALLOWED_SORTS = frozenset(
+    {
+        "timestamp",
+        "created_at",
+        "latitude",
+        "longitude",
+        "accuracy",
+        "altitude",
+        "velocity",
+        "battery",
+        "battery_status",
+    }
+)
+
+_ALLOWED_ORDERS = frozenset({"ASC", "DESC"})
+
+
+def _cast_numeric_to_float(value: str | None, cursor: Any) -> float | None:
+    """psycopg2 typecaster: return NUMERIC columns as float instead of Decimal."""
+    return float(value) if value is not None else None
+
+
+# OIDs 701 (float8) and 1700 (numeric): have the C typecast path hand back
+# native floats directly, so no per-row Decimal -> float conversion runs in
+# Python on the hot path.
+_NUMERIC_AS_FLOAT = extensions.new_type((701, 1700), "NUMERIC_AS_FLOAT", _cast_numeric_to_float)
+
+
+@cache
+def _locations_query(sort_column: str, order: str, with_device: bool) -> str:
+    """Build (once per combination) the locations SELECT statement.
+
+    Only the validated sort column, the order, and the presence of the
+    device filter vary, so there are a few dozen distinct statements at
+    most; caching them avoids rebuilding the query text on every call.
+    Server-side PREPARE is deliberately not used — named prepared
+    statements do not survive PgBouncer transaction pooling.
+    """
+    device_filter = "WHERE device_id = %s" if with_device else ""
+    return f"""
+        SELECT id, device_id, tid, latitude::float8, longitude::float8,
+               accuracy, altitude, velocity, battery, battery_status,
+               connection_type, trigger, timestamp, created_at, raw_payload
+        FROM public.locations
+        {device_filter}
+        ORDER BY {sort_column} {order}
+        LIMIT %s OFFSET %s
+    """
+
+
+def _to_float_safe(value: Any, field: str, record_id: Any) -> float | None:
+    """Safely convert value to float, returning None on failure."""
+    if type(value) is float or value is None:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        logger.warning(
+            "Invalid %s value %r for location id %r; storing as None",
+            field,
+            value,
+            record_id,
+        )
+        return None
+
+
 class DatabaseService:
     """Database service with connection pooling.
 
@@ -101,11 +178,20 @@ class DatabaseService:
         """
         self._config.validate_database()
 
+        # Process-wide and idempotent; float/numeric columns decode straight
+        # to float in the C extension from here on.
+        extensions.register_type(_NUMERIC_AS_FLOAT)
+
         logger.info(
             f"Initializing database pool: {self._config.db_host}:{self._config.db_port}"
             f"/{self._config.db_name} (min={self._config.db_pool_min}, max={self._config.db_pool_max})"
         )
 
+        # ThreadedConnectionPool serializes getconn/putconn behind one lock,
+        # but each gunicorn worker runs only a handful of threads and
+        # PgBouncer does the real pooling server-side, so the lock is not a
+        # bottleneck here. TCP keepalives stop PgBouncer/idle reaping from
+        # silently killing pooled connections between requests.
         self._pool = pool.ThreadedConnectionPool(
             minconn=self._config.db_pool_min,
             maxconn=self._config.db_pool_max,
@@ -115,10 +201,43 @@ class DatabaseService:
             user=self._config.db_user,
             password=self._config.db_password,
             connect_timeout=self._config.db_connect_timeout,
+            keepalives=1,
+            keepalives_idle=30,
         )
 
+        self._warm_pool()
+
         logger.info("Database pool initialized successfully")
 
+    def _warm_pool(self) -> None:
+        """Warm the minimum-pool connections in parallel.
+
+        Runs SELECT 1 on each of the minimum connections concurrently so
+        PgBouncer backend negotiation happens at startup instead of inside
+        the first requests a fresh worker serves. Warm-up failures are
+        logged but not fatal — the pool itself was already created.
+        """
+        if self._pool is None:
+            return
+        db_pool = self._pool
+
+        def warm() -> None:
+            conn = db_pool.getconn()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+            finally:
+                db_pool.putconn(conn)
+
+        workers = max(self._config.db_pool_min, 1)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(warm) for _ in range(workers)]
+                for future in as_completed(futures, timeout=5):
+                    future.result()
+        except Exception as e:
+            logger.warning(f"Connection pool warm-up failed: {e}")
+
     def close(self) -> None:
         """Close all connections in the pool."""
         if self._pool:
@@ -195,84 +314,67 @@ class DatabaseService:
         limit = min(max(limit, 1), 100)
         offset = max(offset, 0)
 
-        allowed_sorts = {
-            "timestamp": "timestamp",
-            "created_at": "created_at",
-            "latitude": "latitude",
-            "longitude": "longitude",
-            "accuracy": "accuracy",
-            "altitude": "altitude",
-            "velocity": "velocity",
-            "battery": "battery",
-            "battery_status": "battery_status",
-        }
-        # Default to created_at to avoid unstable ordering when timestamp may be NULL
-        sort_column = allowed_sorts.get(sort, "created_at")
+        sort_column = sort if sort in _ALLOWED_SORTS else "created_at"
 
-        order = "DESC" if order.upper() not in ("ASC", "DESC") else order.upper()
+        order = order.upper()
+        if order not in _ALLOWED_ORDERS:
+            order = "DESC"
 
-        with self.get_connection() as conn, conn.cursor() as cur:
-            if device_id:
-                query = f"""
-                    SELECT id, device_id, tid, latitude, longitude,
-                           accuracy, altitude, velocity, battery, battery_status,
-                           connection_type, trigger, timestamp, created_at, raw_payload
-                    FROM public.locations
-                    WHERE device_id = %s
-                    ORDER BY {sort_column} {order}
-                    LIMIT %s OFFSET %s
-                """
-                cur.execute(query, (device_id, limit, offset))
-            else:
-                query = f"""
-                    SELECT id, device_id, tid, latitude, longitude,
-                           accuracy, altitude, velocity, battery, battery_status,
-                           connection_type, trigger, timestamp, created_at, raw_payload
-                    FROM public.locations
-                    ORDER BY {sort_column} {order}
-                    LIMIT %s OFFSET %s
-                """
-                cur.execute(query, (limit, offset))
+        query = _locations_query(sort_column, order, bool(device_id))
+        params = (device_id, limit, offset) if device_id else (limit, offset)
 
+        with self.get_connection() as conn, conn.cursor() as cur:
+            # Result size is bounded by the 100-row LIMIT, so one batched
+            # fetch is cheaper than streaming; arraysize keeps the driver
+            # from fetching in smaller chunks. A server-side named cursor
+            # was considered and skipped — it buys nothing under a hard
+            # LIMIT and named portals don't mix with PgBouncer transaction
+            # pooling.
+            cur.arraysize = limit
+            cur.execute(query, params)
             rows = cur.fetchall()
 
-        def _to_float_safe(value: Any, field: str, record_id: Any) -> float | None:
-            """Safely convert value to float, returning None on failure."""
-            if value is None:
-                return None
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                logger.warning(
-                    "Invalid %s value %r for location id %r; storing as None",
-                    field,
-                    value,
-                    record_id,
-                )
-                return None
-
+        # Positional construction in SELECT column order; only lat/lon and
+        # the timestamps need per-field conversion.
         return [
             LocationRecord(
-                id=row[0],
-                device_id=row[1],
-                tid=row[2],
-                latitude=_to_float_safe(row[3], "latitude", row[0]),
-                longitude=_to_float_safe(row[4], "longitude", row[0]),
-                accuracy=row[5],
-                altitude=row[6],
-                velocity=row[7],
-                battery=row[8],
-                battery_status=row[9],
-                connection_type=row[10],
-                trigger=row[11],
-                timestamp=row[12].isoformat() if row[12] else None,
-                created_at=row[13].isoformat() if row[13] else None,
-                raw_payload=row[14],
+                row[0],
+                row[1],
+                row[2],
+                _to_float_safe(row[3], "latitude", row[0]),
+                _to_float_safe(row[4], "longitude", row[0]),
+                row[5],
+                row[6],
+                row[7],
+                row[8],
+                row[9],
+                row[10],
+                row[11],
+                row[12].isoformat() if row[12] else None,
+                row[13].isoformat() if row[13] else None,
+                row[14],
             )
             for row in rows
         ]
 
 
+def serialize_locations_response(payload: dict[str, Any]) -> bytes:
+    """Serialize a locations response envelope to JSON bytes.
+
+    orjson encodes the LocationRecord dataclasses directly in C, skipping
+    the per-row to_dict() dict build and stdlib json's per-key escaping —
+    the two main costs on the 100-row response path.
+
+    Args:
+        payload: Response envelope; the "locations" value may contain
+            LocationRecord instances.
+
+    Returns:
+        UTF-8 encoded JSON bytes.
+    """
+    return orjson.dumps(payload)
+
+
 # Global database service instance (initialized by app factory)
 _db_service: DatabaseService | None = None
 _db_service_lock = threading.Lock()
@@ -309,11 +411,16 @@ def init_db_service(config: Config) -> DatabaseService:
         Exception: If database connection fails.
     """
     global _db_service
+    # Double-checked fast path: once initialized, callers never touch the
+    # lock again (reading the global is atomic under the GIL).
+    if _db_service is not None:
+        return _db_service
     with _db_service_lock:
         if _db_service is not None:
             return _db_service
-        _db_service = DatabaseService(config)
-        _db_service.initialize()  # Let exceptions propagate
+        service = DatabaseService(config)
+        service.initialize()  # Let exceptions propagate
+        _db_service = service
         return _db_service
 
 
@@ -7,8 +7,14 @@ data directory, with path traversal protection.
 
 from __future__ import annotations
 
+import fcntl
 import logging
+import mmap
+import os
+import stat
+import struct
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -18,10 +24,41 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Open file description (OFD) locks are scoped to the open file description
+# rather than the process, so they behave correctly over NFS where classic
+# POSIX locks do not. Fall back to process-scoped locks on platforms
+# without OFD support (e.g. macOS dev machines).
+_F_SETLKW = getattr(fcntl, "F_OFD_SETLKW", fcntl.F_SETLKW)
 
-@dataclass
+# struct flock: l_type, l_whence, l_start, l_len, l_pid (lock whole file)
+_WRLCK_WHOLE_FILE = struct.pack("hhqqi", fcntl.F_WRLCK, 0, 0, 0, 0)
+
+
+def _lock_exclusive(fd: int) -> None:
+    """Take an exclusive whole-file lock on an open fd (blocking)."""
+    fcntl.fcntl(fd, _F_SETLKW, _WRLCK_WHOLE_FILE)
+
+
+# Files larger than this are memory-mapped for reading instead of going
+# through read(): decoding straight from the mapped pages skips the
+# intermediate bytes copy, and the page cache doubles as the read buffer.
+_MMAP_READ_THRESHOLD = 256 * 1024
+
+# Directory listings above this size collect their per-entry stats on a
+# thread pool. Each uncached stat on the NFS mount is a network
+# round-trip, and the round-trips overlap almost perfectly; small
+# directories stay on the serial path to avoid pool dispatch overhead.
+_PARALLEL_STAT_THRESHOLD = 32
+
+
+@dataclass(slots=True, frozen=True)
 class FileInfo:
-    """Information about a file or directory."""
+    """Information about a file or directory.
+
+    Slotted because large directory listings build one per entry, and
+    frozen because entries are built once from a scandir pass (or served
+    from the listing cache) and only ever read afterwards.
+    """
 
     name: str
     type: str  # "file" or "directory"
@@ -85,6 +122,15 @@ class StorageService:
             data_dir: Root directory for all storage operations.
         """
         self._data_dir = data_dir.resolve()
+        # Shared pool for stat fan-out on large directories; threads are
+        # spawned on demand, so the pool costs nothing until needed.
+        self._stat_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="storage-stat")
+        # Listing cache keyed by resolved directory path, validated
+        # against the directory's st_mtime_ns (which changes whenever a
+        # name is added or removed). In-place file rewrites do not touch
+        # the parent's mtime, so the mutating methods also invalidate
+        # eagerly. Lost races under gthread workers just recompute.
+        self._listing_cache: dict[str, tuple[int, list[FileInfo]]] = {}
 
     @property
     def data_dir(self) -> Path:
@@ -103,17 +149,21 @@ class StorageService:
         Raises:
             InvalidPathError: If path attempts traversal outside data directory.
         """
-        if not filepath:
+        if not filepath or "\x00" in filepath:
+            if filepath:
+                raise InvalidPathError(f"Invalid path: {filepath}")
             return self._data_dir
 
-        try:
-            target = (self._data_dir / filepath).resolve()
-            # Ensure path is within data directory
-            if self._data_dir in target.parents or target == self._data_dir:
-                return target
+        # Lexical containment check: normpath collapses "." and ".."
+        # segments as pure string work, where resolve() lstat()s every
+        # path component — one NFS round-trip each. The data dir itself
+        # was resolved once in __init__ and the service never creates
+        # symlinks beneath it, so the string check is sufficient here.
+        root = str(self._data_dir)
+        candidate = os.path.normpath(os.path.join(root, filepath))
+        if candidate != root and not candidate.startswith(root + os.sep):
             raise InvalidPathError(f"Invalid path: {filepath}")
-        except (ValueError, OSError) as e:
-            raise InvalidPathError(f"Invalid path: {filepath}") from e
+        return Path(candidate)
 
     def exists(self, filepath: str) -> bool:
         """Check if a path exists.
@@ -145,6 +195,32 @@ class StorageService:
         except InvalidPathError:
             return False
 
+    def probe(self, filepath: str) -> tuple[str, int]:
+        """Classify a path with a single stat call.
+
+        Replaces the exists()/is_directory() probe pair the blueprint
+        used to make before deciding between a listing and a read.
+
+        Args:
+            filepath: Relative path to probe.
+
+        Returns:
+            ("directory", 0) for directories, ("file", size_in_bytes)
+            for files.
+
+        Raises:
+            InvalidPathError: If path is invalid.
+            PathNotFoundError: If path does not exist.
+        """
+        target = self.get_safe_path(filepath)
+        try:
+            st = target.stat()
+        except FileNotFoundError:
+            raise PathNotFoundError(f"Path not found: {filepath or '/'}") from None
+        if stat.S_ISDIR(st.st_mode):
+            return "directory", 0
+        return "file", st.st_size
+
     def list_directory(self, filepath: str = "") -> list[FileInfo]:
         """List contents of a directory.
 
@@ -160,22 +236,53 @@ class StorageService:
         """
         target = self.get_safe_path(filepath)
 
-        if not target.exists():
-            raise PathNotFoundError(f"Path not found: {filepath or '/'}")
+        # One stat answers existence, type, and the cache-validation
+        # mtime at once.
+        try:
+            st = target.stat()
+        except FileNotFoundError:
+            raise PathNotFoundError(f"Path not found: {filepath or '/'}") from None
 
-        if not target.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise InvalidPathError(f"Not a directory: {filepath}")
 
-        items: list[FileInfo] = []
-        for item in sorted(target.iterdir()):
-            if item.is_dir():
-                items.append(FileInfo(name=item.name, type="directory"))
-            else:
-                items.append(FileInfo(name=item.name, type="file", size=item.stat().st_size))
+        key = str(target)
+        mtime = st.st_mtime_ns
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # scandir's DirEntry objects carry type and stat data from the
+        # directory read itself, so is_dir()/stat() below resolve from
+        # cache when possible instead of issuing one syscall per entry
+        # the way Path.iterdir() + Path.stat() did.
+        with os.scandir(target) as scan:
+            entries = sorted(scan, key=lambda e: e.name)
+
+        if len(entries) > _PARALLEL_STAT_THRESHOLD:
+            # Large directory: overlap the remaining stat round-trips.
+            items = list(self._stat_pool.map(self._entry_info, entries))
+        else:
+            items = [self._entry_info(entry) for entry in entries]
 
-        logger.info(f"Listed directory: {filepath or '/'} ({len(items)} items)")
+        self._listing_cache[key] = (mtime, items)
+        logger.info("Listed directory: %s (%d items)", filepath or "/", len(items))
         return items
 
+    @staticmethod
+    def _entry_info(entry: os.DirEntry[str]) -> FileInfo:
+        """Build a FileInfo from a scandir entry.
+
+        follow_symlinks=False answers from the d_type/stat data the
+        directory read already produced instead of re-statting the link
+        target; the service never creates symlinks under the data dir,
+        so there is nothing to follow.
+        """
+        if entry.is_dir(follow_symlinks=False):
+            return FileInfo(name=entry.name, type="directory")
+        size = entry.stat(follow_symlinks=False).st_size
+        return FileInfo(name=entry.name, type="file", size=size)
+
     def read_file(self, filepath: str) -> tuple[str, int]:
         """Read file content.
 
@@ -191,20 +298,65 @@ class StorageService:
         """
         target = self.get_safe_path(filepath)
 
-        if not target.exists():
-            raise PathNotFoundError(f"Path not found: {filepath}")
-
-        if target.is_dir():
-            raise InvalidPathError(f"Path is a directory: {filepath}")
-
-        content = target.read_text()
-        logger.info(f"Read file: {filepath} ({len(content)} bytes)")
-        return content, len(content)
+        # One open answers existence, and the fstat on the returned fd
+        # gives type and byte size, replacing the separate exists()/
+        # is_dir()/stat() probes. The raw fd read also skips the
+        # FileIO/BufferedReader/TextIOWrapper stack Path.read_text
+        # builds around what is ultimately a single read() syscall.
+        try:
+            fd = os.open(target, os.O_RDONLY)
+        except FileNotFoundError:
+            raise PathNotFoundError(f"Path not found: {filepath}") from None
+        try:
+            st = os.fstat(fd)
+            if stat.S_ISDIR(st.st_mode):
+                raise InvalidPathError(f"Path is a directory: {filepath}")
+            size = st.st_size
+            if size > _MMAP_READ_THRESHOLD:
+                content = self._read_file_mmap(fd, size)
+            else:
+                content = self._read_fd(fd, size).decode("utf-8")
+        finally:
+            os.close(fd)
+        logger.info("Read file: %s (%d bytes)", filepath, size)
+        return content, size
+
+    @staticmethod
+    def _read_fd(fd: int, size: int) -> bytes:
+        """Read size bytes from an fd, tolerating short reads."""
+        data = os.read(fd, size)
+        if len(data) >= size:
+            return data
+        chunks = [data]
+        remaining = size - len(data)
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _read_file_mmap(fd: int, size: int) -> str:
+        """Read a large file by decoding directly from memory-mapped pages."""
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            view = memoryview(mm)
+            try:
+                return str(view, "utf-8")
+            finally:
+                view.release()
 
     def write_file(self, filepath: str, content: str) -> tuple[str, int]:
-        """Write content to a file.
+        """Write content to a file atomically.
 
-        Creates parent directories if needed.
+        Creates parent directories if needed. Writers serialize on an
+        exclusive OFD lock on the target, then write to a temporary file
+        in the same directory and rename it into place. Rename is atomic
+        on POSIX filesystems (including NFS), so concurrent readers never
+        observe a partially written file.
 
         Args:
             filepath: Relative path to file.
@@ -223,10 +375,37 @@ class StorageService:
         # Create parent directories if needed
         target.parent.mkdir(parents=True, exist_ok=True)
 
-        target.write_text(content)
+        # Encode once up front: write_text would encode internally and
+        # len(content) counts characters, under-reporting the on-disk
+        # size for multi-byte UTF-8 content.
+        data = content.encode("utf-8")
+
+        # Serialize concurrent writers on the target itself; the lock is
+        # released when the fd is closed.
+        lock_fd = os.open(target, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            _lock_exclusive(lock_fd)
+            # The OFD lock lives on the pre-replace inode, so a writer
+            # that was blocked across a replace can run concurrently with
+            # a fresh writer in the same process; the thread id keeps
+            # their temp files from colliding.
+            tmp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, target)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        finally:
+            os.close(lock_fd)
+
+        # An in-place rewrite does not bump the parent's mtime, so the
+        # cached listing (which carries file sizes) must be dropped here.
+        self._listing_cache.pop(str(target.parent), None)
+
         status = "updated" if existed else "created"
-        logger.info(f"File {status}: {filepath} ({len(content)} bytes)")
-        return status, len(content)
+        logger.info("File %s: %s (%d bytes)", status, filepath, len(data))
+        return status, len(data)
 
     def delete(self, filepath: str) -> str:
         """Delete a file or empty directory.
@@ -253,10 +432,22 @@ class StorageService:
             target.rmdir()
             file_type = "directory"
         else:
-            target.unlink()
+            # Wait for any in-flight writer before unlinking so a reader
+            # never sees the file vanish mid-write.
+            try:
+                lock_fd = os.open(target, os.O_WRONLY)
+            except FileNotFoundError:
+                raise PathNotFoundError(f"Path not found: {filepath}") from None
+            try:
+                _lock_exclusive(lock_fd)
+                target.unlink(missing_ok=True)
+            finally:
+                os.close(lock_fd)
             file_type = "file"
 
-        logger.info(f"Deleted {file_type}: {filepath}")
+        self._listing_cache.pop(str(target), None)
+        self._listing_cache.pop(str(target.parent), None)
+        logger.info("Deleted %s: %s", file_type, filepath)
         return file_type
 
     def create_directory(self, filepath: str) -> str:
@@ -281,7 +472,8 @@ class StorageService:
             raise InvalidPathError(f"Path exists as file: {filepath}")
 
         target.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created directory: {filepath}")
+        self._listing_cache.pop(str(target.parent), None)
+        logger.info("Created directory: %s", filepath)
         return "created"
 
 
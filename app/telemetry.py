@@ -11,20 +11,46 @@ Provides centralized setup for:
 from __future__ import annotations
 
 import logging
+import os
 from typing import TYPE_CHECKING
 
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.instrumentation.grpc import GrpcInstrumentorClient
 from opentelemetry.instrumentation.psycopg2 import Psycopg2Instrumentor
 from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_NAMESPACE, Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
 if TYPE_CHECKING:
     from app.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Module-level tracer cache: trace.get_tracer() walks the provider's
+# tracer registry (dict lookup behind a lock) on every call, so resolve
+# it once and reuse.
+_tracer: trace.Tracer | None = None
+
+# Preformatted IDs for untraced records, so the common no-span case
+# allocates nothing per record.
+_ZERO_TRACE_ID = "0" * 32
+_ZERO_SPAN_ID = "0" * 16
+
+
+def _tracing_disabled() -> bool:
+    """Check whether tracing is switched off via standard OTel env vars.
+
+    Honors `OTEL_SDK_DISABLED=true` and `OTEL_TRACES_EXPORTER=none`, which
+    tooling (e.g. scripts/generate-spec-from-code.py) sets to keep one-shot
+    invocations from paying instrumentation and export overhead.
+    """
+    return (
+        os.getenv("OTEL_SDK_DISABLED", "").lower() == "true"
+        or os.getenv("OTEL_TRACES_EXPORTER", "otlp") == "none"
+    )
+
 
 class TraceIdLogFilter(logging.Filter):
     """Log filter that adds OpenTelemetry trace context to log records.
@@ -42,14 +68,16 @@ class TraceIdLogFilter(logging.Filter):
         Returns:
             Always returns True (all records pass through).
         """
-        span = trace.get_current_span()
-        if span.is_recording():
-            ctx = span.get_span_context()
-            record.otelTraceID = format(ctx.trace_id, "032x")
-            record.otelSpanID = format(ctx.span_id, "016x")
+        # This filter runs on every log record, so keep it lean: a zero
+        # trace_id means "no span" (one int compare, cheaper than
+        # is_recording()), and f-string hex formatting beats format().
+        ctx = trace.get_current_span().get_span_context()
+        if ctx.trace_id:
+            record.otelTraceID = f"{ctx.trace_id:032x}"
+            record.otelSpanID = f"{ctx.span_id:016x}"
         else:
-            record.otelTraceID = "0" * 32
-            record.otelSpanID = "0" * 16
+            record.otelTraceID = _ZERO_TRACE_ID
+            record.otelSpanID = _ZERO_SPAN_ID
         return True
 
 
@@ -57,8 +85,17 @@ def configure_logging() -> None:
     """Configure logging with trace correlation format.
 
     Sets up the root logger with a format that includes trace and span IDs,
-    and adds the TraceIdLogFilter to all handlers.
+    and adds the TraceIdLogFilter to all handlers. When tracing is disabled
+    (spec generation, one-shot scripts), the filter — which runs on every
+    log record — is skipped along with the trace-id fields it would fill.
     """
+    if _tracing_disabled():
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
+        return
+
     logging.basicConfig(
         level=logging.INFO,
         format=(
@@ -94,29 +131,57 @@ def configure_opentelemetry(config: Config) -> trace.Tracer:
         }
     )
 
-    provider = TracerProvider(resource=resource)
+    # Head-based ratio sampling is the main lever on tracing overhead:
+    # ParentBased keeps traces consistent (children follow the root's
+    # decision) while TraceIdRatioBased caps the volume of root spans.
+    # Ratio 1.0 (the default) keeps today's trace-everything behavior.
+    sampler = ParentBased(TraceIdRatioBased(config.trace_sample_ratio))
+    provider = TracerProvider(resource=resource, sampler=sampler)
 
-    logger.info(f"Configuring OTLP exporter to: {config.otel_endpoint}")
+    logger.info(
+        f"Configuring OTLP exporter to: {config.otel_endpoint} "
+        f"(sample ratio {config.trace_sample_ratio})"
+    )
 
     exporter = OTLPSpanExporter(
         endpoint=config.otel_endpoint,
         insecure=True,  # Using cluster-internal communication
     )
 
-    processor = BatchSpanProcessor(exporter)
+    # Explicit batch shape: a 2048-span queue absorbs request bursts
+    # without dropping, and 512-span batches every 5s keep export RPCs
+    # large and infrequent.
+    processor = BatchSpanProcessor(
+        exporter,
+        max_queue_size=2048,
+        max_export_batch_size=512,
+        schedule_delay_millis=5000,
+        export_timeout_millis=30000,
+    )
     provider.add_span_processor(processor)
     trace.set_tracer_provider(provider)
 
-    # Instrument psycopg2 for database tracing (after tracer provider is set)
+    # Instrument psycopg2 and the gRPC client for tracing (after tracer
+    # provider is set). The gRPC instrumentation used to run at
+    # distance_client import time, which monkey-patched every stub call —
+    # and paid the per-call wrapper cost — even when tracing was disabled.
     Psycopg2Instrumentor().instrument()
+    if not _tracing_disabled():
+        GrpcInstrumentorClient().instrument()
 
-    return trace.get_tracer(__name__)
+    global _tracer
+    _tracer = trace.get_tracer(__name__)
+    return _tracer
 
 
 def get_tracer() -> trace.Tracer:
     """Get the current tracer instance.
 
     Returns:
-        The global tracer for the application module.
+        The cached global tracer, resolved against the current provider on
+        first use if configure_opentelemetry has not run.
     """
-    return trace.get_tracer(__name__)
+    global _tracer
+    if _tracer is None:
+        _tracer = trace.get_tracer(__name__)
+    return _tracer
@@ -0,0 +1,27 @@
+"""Gunicorn configuration for the otel-demo app.
+
+Centralizes the server tuning that used to live inline in the Dockerfile
+CMD, and makes worker/thread counts overridable per environment without
+rebuilding the image.
+
+Threaded (gthread) workers are used rather than gevent: both the gRPC
+C-core in DistanceClient and psycopg2 run real OS threads that gevent's
+monkey-patching does not cooperate with, and the app's blocking work
+(NFS I/O, PgBouncer queries, worker RPCs) overlaps fine under threads.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+
+# 2 workers x 4 threads matches the previous Dockerfile CMD; WEB_CONCURRENCY
+# and GUNICORN_THREADS allow scaling per deployment.
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread"
+
+# Keep client connections open between requests so pollers (job status,
+# health probes) reuse the TCP connection instead of reconnecting.
+keepalive = 30
+
+accesslog = "-"
@@ -20,18 +20,20 @@ import os
 from dotenv import load_dotenv
 
 from app import create_app
-from app.config import Config
+from app.config import get_config
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Create application with configuration from environment
-config = Config.from_env()
+config = get_config()
 app = create_app(config)
 
 logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
+    # Local development only: the Flask dev server handles one request at
+    # a time. Production runs `gunicorn -c gunicorn.conf.py run:app`.
     port = int(os.getenv("PORT", 8080))
-    logger.info(f"Starting otel-demo on port {port}")
+    logger.warning("Starting Flask development server on port %d (local use only)", port)
     app.run(host="0.0.0.0", port=port, debug=False)
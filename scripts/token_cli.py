@@ -7,37 +7,202 @@ Configurable via environment variables or CLI flags:
     COGNITO_CLIENT_ID     - OAuth2 client ID
     COGNITO_CLIENT_SECRET - OAuth2 client secret
     COGNITO_SCOPE         - Space-delimited scopes (default: "openid email profile")
+    COGNITO_CONNECT_TIMEOUT - Connect timeout in seconds (default: 3)
+    COGNITO_READ_TIMEOUT  - Read timeout in seconds (default: 7)
 """
 
 from __future__ import annotations
 
 import argparse
-import base64
+import hashlib
 import json
 import os
 import sys
-import urllib.error
+import threading
+import time
 import urllib.parse
-import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
 
-def _build_request(
-    token_url: str, client_id: str, client_secret: str, scope: str
-) -> urllib.request.Request:
-    """Build a token request with Basic auth and form-encoded body."""
-    body = urllib.parse.urlencode(
-        {
-            "grant_type": "client_credentials",
-            "scope": scope,
-        }
-    ).encode()
+# orjson parses/serializes bytes directly in C, a 2-5x win on the small
+# JSON payloads the IdP returns. Optional so the script still runs in
+# stripped environments without the app's requirements installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
-    auth_header = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+# Module-level session: library-mode callers (and any future loop in this
+# process) reuse pooled TLS connections to the IdP instead of paying a
+# fresh TCP+TLS handshake per token request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
 
-    req = urllib.request.Request(token_url, data=body, method="POST")
-    req.add_header("Content-Type", "application/x-www-form-urlencoded")
-    req.add_header("Authorization", f"Basic {auth_header}")
-    return req
+# Separate connect/read deadlines: a stuck DNS lookup or TCP SYN fails
+# after the short connect timeout instead of consuming the whole budget,
+# while slow-but-working IdPs still get read headroom.
+_CONNECT_TIMEOUT = float(os.getenv("COGNITO_CONNECT_TIMEOUT", "3"))
+_READ_TIMEOUT = float(os.getenv("COGNITO_READ_TIMEOUT", "7"))
+
+# Issued tokens are cached on disk so repeated invocations (shell loops,
+# Makefile targets) skip the TLS handshake and token exchange while a
+# previous token is still valid.
+_CACHE_DIR = Path(os.path.expanduser("~/.cache/otel-demo"))
+
+# Seconds of remaining lifetime a cached token must have to be reused.
+_CACHE_SAFETY_MARGIN = 30
+
+# Precomputed static part of the client-credentials form body; only the
+# scope varies per call, so skip re-encoding the rest of the dict on the
+# hot library path.
+_CLIENT_CREDENTIALS_BODY = "grant_type=client_credentials&scope="
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def _cache_path(token_url: str, client_id: str, scope: str) -> Path:
+    """Return the cache file path for a (token_url, client_id, scope) tuple."""
+    key = hashlib.sha256(f"{token_url}|{client_id}|{scope}".encode()).hexdigest()
+    return _CACHE_DIR / f"{key}.json"
+
+
+# In-flight deduplication for library-mode callers: concurrent threads
+# requesting the same (token_url, client_id, scope) share one upstream
+# token exchange instead of stampeding the IdP on expiry.
+_INFLIGHT: dict[str, Future[dict]] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _read_cache(path: Path) -> dict | None:
+    """Return the cached payload regardless of expiry, or None."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)  # type: ignore[no-any-return]
+    except (OSError, ValueError):
+        return None
+
+
+def _load_cached_token(path: Path) -> dict | None:
+    """Return the cached token payload if it has enough lifetime left."""
+    payload = _read_cache(path)
+    if payload and payload.get("expires_at", 0) - time.time() > _CACHE_SAFETY_MARGIN:
+        return payload
+    return None
+
+
+def _store_cached_token(path: Path, payload: dict) -> None:
+    """Cache the token payload atomically with a computed absolute expiry.
+
+    Best-effort: a read-only HOME or full disk must not fail the fetch.
+    """
+    record = {**payload, "expires_at": time.time() + payload.get("expires_in", 3600)}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(record, fh)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _fetch_token(
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    scope: str,
+    refresh_token: str | None = None,
+) -> dict:
+    """POST to the token endpoint and return the parsed payload."""
+    if refresh_token:
+        data = urllib.parse.urlencode(
+            {"grant_type": "refresh_token", "refresh_token": refresh_token}
+        )
+    else:
+        data = _CLIENT_CREDENTIALS_BODY + urllib.parse.quote_plus(scope)
+    resp = _SESSION.post(
+        token_url,
+        data=data,
+        headers=_FORM_HEADERS,
+        auth=(client_id, client_secret),
+        timeout=(_CONNECT_TIMEOUT, _READ_TIMEOUT),
+    )
+    resp.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(resp.content)  # type: ignore[no-any-return]
+    return resp.json()
+
+
+def get_token(token_url: str, client_id: str, client_secret: str, scope: str) -> dict:
+    """Return a token payload, reusing the cache where possible.
+
+    Thread-safe entry point for library-mode callers. A cached token with
+    remaining lifetime is returned directly; an expired entry that carries a
+    refresh_token is renewed with the cheaper refresh grant (falling back to
+    client credentials if the refresh is rejected). Concurrent callers for
+    the same credentials share a single in-flight request.
+    """
+    cache_path = _cache_path(token_url, client_id, scope)
+    key = str(cache_path)
+
+    with _INFLIGHT_LOCK:
+        payload = _load_cached_token(cache_path)
+        if payload is not None:
+            return payload
+        inflight = _INFLIGHT.get(key)
+        if inflight is None:
+            future: Future[dict] = Future()
+            _INFLIGHT[key] = future
+
+    if inflight is not None:
+        return inflight.result()
+
+    try:
+        stale = _read_cache(cache_path)
+        refresh = (stale or {}).get("refresh_token")
+        try:
+            payload = _fetch_token(token_url, client_id, client_secret, scope, refresh)
+        except requests.RequestException:
+            if not refresh:
+                raise
+            # Refresh token revoked or expired: fall back to a full grant.
+            payload = _fetch_token(token_url, client_id, client_secret, scope)
+        if refresh and "refresh_token" not in payload:
+            # Some IdPs omit the refresh token on renewal; keep the old one.
+            payload["refresh_token"] = refresh
+        _store_cached_token(cache_path, payload)
+        future.set_result(payload)
+        return payload
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def fetch_many(configs: list[dict]) -> list[dict | BaseException]:
+    """Fetch tokens for several credential sets concurrently.
+
+    Each config is a kwargs dict for get_token() (token_url, client_id,
+    client_secret, scope). Results come back in input order; a failed
+    fetch yields its exception instead of raising, so one bad tenant
+    does not sink the batch. Token exchanges are I/O-bound, so a thread
+    pool over the pooled session overlaps them effectively; the pool is
+    sized to match the session's per-host connection limit.
+    """
+    with ThreadPoolExecutor(max_workers=10, thread_name_prefix="token-fetch") as pool:
+        futures = [pool.submit(get_token, **config) for config in configs]
+        results: list[dict | BaseException] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:  # noqa: BLE001
+                results.append(exc)
+        return results
 
 
 def _print_token(payload: dict, output: str) -> None:
@@ -49,7 +214,10 @@ def _print_token(payload: dict, output: str) -> None:
     if output == "header":
         print(f"Authorization: Bearer {token}")
     elif output == "json":
-        print(json.dumps(payload, indent=2))
+        if orjson is not None:
+            print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(json.dumps(payload, indent=2))
     else:
         print(token)
 
@@ -99,24 +267,18 @@ def main() -> int:
     if missing:
         parser.error(f"Missing required values for: {', '.join(missing)}")
 
-    req = _build_request(args.token_url, args.client_id, args.client_secret, args.scope)
-
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            payload = json.loads(resp.read().decode())
-    except urllib.error.HTTPError as exc:
-        sys.stderr.write(f"Token request failed: {exc.code} {exc.reason}\n")
-        try:
-            detail = exc.read().decode()
-            if detail:
-                sys.stderr.write(f"Response: {detail}\n")
-        except Exception:
-            pass
+        payload = get_token(args.token_url, args.client_id, args.client_secret, args.scope)
+    except requests.HTTPError as exc:
+        response = exc.response
+        sys.stderr.write(f"Token request failed: {response.status_code} {response.reason}\n")
+        if response.text:
+            sys.stderr.write(f"Response: {response.text}\n")
         return 1
-    except urllib.error.URLError as exc:
+    except requests.RequestException as exc:
         sys.stderr.write(f"Token request failed: {exc}\n")
         return 1
-    except json.JSONDecodeError:
+    except ValueError:
         sys.stderr.write("Token request failed: invalid JSON response\n")
         return 1
 
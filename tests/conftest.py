@@ -7,27 +7,62 @@ mocked dependencies for OpenTelemetry.
 
 from __future__ import annotations
 
+import os
+import sys
 from collections.abc import Generator
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.protobuf.internal import api_implementation
 
 from app import create_app
 from app.config import Config
 
+# The distance tests construct many protobuf messages; the pure-Python
+# protobuf runtime is orders of magnitude slower than the C-accelerated
+# backends ("upb" on protobuf>=4, "cpp" before that). Fail loudly at
+# collection instead of silently running the suite on the slow fallback.
+if api_implementation.Type() == "python":  # pragma: no cover
+    raise RuntimeError(
+        "protobuf is running its pure-Python backend; reinstall the binary "
+        "wheel — the tests assume the C-accelerated runtime"
+    )
+
 if TYPE_CHECKING:
     from flask import Flask
     from flask.testing import FlaskClient
 
 
-@pytest.fixture
-def test_config() -> Config:
-    """Create a test configuration."""
+def pytest_configure(config: pytest.Config) -> None:
+    """Put pytest's tmp dirs on tmpfs when available.
+
+    The storage tests exercise real file I/O under tmp_path; backing
+    them with /dev/shm keeps those writes off the block layer entirely.
+    Honors an explicit --basetemp, and keys the directory by xdist
+    worker id so parallel workers never share (and never clear) each
+    other's base directory.
+    """
+    if not sys.platform.startswith("linux") or config.option.basetemp is not None:
+        return
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        config.option.basetemp = shm / f"pytest-otel-demo-{worker}"
+
+
+@pytest.fixture(scope="session")
+def test_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    """Create a test configuration.
+
+    data_dir comes from tmp_path_factory rather than a fixed /tmp path so
+    each pytest-xdist worker gets its own directory and parallel runs
+    cannot race on shared files.
+    """
     return Config(
         port=8080,
-        data_dir=Path("/tmp/test-data"),
+        data_dir=tmp_path_factory.mktemp("otel-demo-data"),
         otel_endpoint="localhost:4317",
         service_name="otel-demo-test",
         service_namespace="test",
@@ -48,32 +83,72 @@ def test_config() -> Config:
         cognito_domain="",
         cognito_client_id="",
         oauth2_enabled=False,
+        # Drop every span at the sampler: handlers still see valid trace
+        # ids on the non-recording spans (responses keep their trace_id
+        # field), but the SDK skips attribute recording and the processor
+        # queue entirely.
+        trace_sample_ratio=0.0,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_otel() -> Generator[MagicMock, None, None]:
     """Mock OpenTelemetry to avoid actual tracing during tests."""
     with (
         patch("app.telemetry.OTLPSpanExporter") as mock_exporter,
         patch("app.telemetry.BatchSpanProcessor") as mock_processor,
         patch("app.telemetry.Psycopg2Instrumentor") as mock_psycopg2,
+        patch("app.telemetry.GrpcInstrumentorClient") as mock_grpc,
     ):
         mock_exporter.return_value = MagicMock()
         mock_processor.return_value = MagicMock()
         mock_psycopg2.return_value.instrument = MagicMock()
+        mock_grpc.return_value.instrument = MagicMock()
         yield mock_exporter
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app(test_config: Config, mock_otel: MagicMock) -> Flask:
-    """Create test Flask application."""
+    """Create test Flask application.
+
+    Session-scoped: create_app() imports blueprints, registers routes,
+    and wires telemetry, so building it once per session instead of per
+    test cuts suite wall time. Tests must not mutate app.config directly;
+    use monkeypatch.setitem(app.config, ...) so changes roll back.
+    """
     flask_app = create_app(test_config)
     flask_app.config["TESTING"] = True
     return flask_app
 
 
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No-op the demo blueprint's time.sleep.
+
+    /slow and /chain burn real wall time (up to ~2s per request) purely
+    for demonstration; the tests assert on the reported delay values,
+    which are computed before sleeping, so skipping the sleep changes
+    nothing they cover.
+    """
+    monkeypatch.setattr("app.blueprints.demo.time.sleep", lambda _seconds: None)
+
+
+@pytest.fixture(autouse=True)
+def _frozen_proto_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin protobuf Timestamp.GetCurrentTime to a fixed instant.
+
+    The distance tests stamp queued_at/started_at/completed_at on every
+    mocked response; none assert on the real time, so a preset value
+    skips the clock_gettime syscall and conversion per call and removes
+    any timing dependence from the outputs.
+    """
+    monkeypatch.setattr(
+        "google.protobuf.timestamp_pb2.Timestamp.GetCurrentTime",
+        lambda self: self.FromSeconds(1737763200),
+    )
+
+
 @pytest.fixture
 def client(app: Flask) -> FlaskClient:
-    """Create test client for making requests."""
+    """Create a fresh test client per test (cheap against the shared app)."""
     return app.test_client()
@@ -5,27 +5,42 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from app.services.database import LocationRecord
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from flask.testing import FlaskClient
 
 
+@pytest.fixture(autouse=True)
+def mock_db_service() -> Generator[MagicMock, None, None]:
+    """Patch the blueprint's service accessor once per test.
+
+    Every test in this module talks to a mocked DatabaseService, so a
+    single autouse fixture replaces the per-test @patch decorators;
+    tests configure return values/side effects on the yielded mock.
+    """
+    with patch("app.blueprints.database._get_or_init_db_service") as mock_get:
+        service = MagicMock()
+        mock_get.return_value = service
+        yield service
+
+
 class TestDatabaseStatusEndpoint:
     """Test cases for /db/status endpoint."""
 
-    @patch("app.blueprints.database._get_or_init_db_service")
-    def test_db_status_connected(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_db_status_connected(self, mock_db_service: MagicMock, client: FlaskClient) -> None:
         """Test that /db/status returns connection info when connected."""
-        mock_service = MagicMock()
-        mock_service.health_check.return_value = {
+        mock_db_service.health_check.return_value = {
             "status": "connected",
             "database": "owntracks",
             "host": "192.168.1.175",
             "port": 6432,
             "server_version": "PostgreSQL 14.0",
         }
-        mock_get_service.return_value = mock_service
 
         response = client.get("/db/status")
 
@@ -35,10 +50,9 @@ class TestDatabaseStatusEndpoint:
         assert data["database"] == "owntracks"
         assert "trace_id" in data
 
-    @patch("app.blueprints.database._get_or_init_db_service")
-    def test_db_status_error(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_db_status_error(self, mock_db_service: MagicMock, client: FlaskClient) -> None:
         """Test that /db/status returns 500 on connection failure."""
-        mock_get_service.side_effect = Exception("Connection refused")
+        mock_db_service.health_check.side_effect = Exception("Connection refused")
 
         response = client.get("/db/status")
 
@@ -47,14 +61,11 @@ class TestDatabaseStatusEndpoint:
         assert data["status"] == "error"
         assert "trace_id" in data
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_status_response_is_json(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_db_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that /db/status returns JSON content type."""
-        mock_service = MagicMock()
-        mock_service.health_check.return_value = {"status": "connected"}
-        mock_get_service.return_value = mock_service
+        mock_db_service.health_check.return_value = {"status": "connected"}
 
         response = client.get("/db/status")
 
@@ -64,13 +75,11 @@ class TestDatabaseStatusEndpoint:
 class TestDatabaseLocationsEndpoint:
     """Test cases for /db/locations endpoint."""
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_locations_returns_data(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_db_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that /db/locations returns location records."""
-        mock_service = MagicMock()
-        mock_service.get_locations.return_value = [
+        mock_db_service.get_locations.return_value = [
             LocationRecord(
                 id=1,
                 device_id="iphone",
@@ -89,7 +98,6 @@ class TestDatabaseLocationsEndpoint:
                 raw_payload='{"test": "data"}',
             )
         ]
-        mock_get_service.return_value = mock_service
 
         response = client.get("/db/locations")
 
@@ -100,19 +108,16 @@ class TestDatabaseLocationsEndpoint:
         assert data["locations"][0]["device_id"] == "iphone"
         assert "trace_id" in data
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_locations_with_params(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_db_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that /db/locations accepts query parameters."""
-        mock_service = MagicMock()
-        mock_service.get_locations.return_value = []
-        mock_get_service.return_value = mock_service
+        mock_db_service.get_locations.return_value = []
 
         response = client.get("/db/locations?limit=10&offset=5&sort=latitude&order=asc")
 
         assert response.status_code == 200
-        mock_service.get_locations.assert_called_once_with(
+        mock_db_service.get_locations.assert_called_once_with(
             limit=10,
             offset=5,
             sort="latitude",
@@ -120,26 +125,20 @@ class TestDatabaseLocationsEndpoint:
             device_id=None,
         )
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_locations_with_device_id(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_db_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that /db/locations filters by device_id."""
-        mock_service = MagicMock()
-        mock_service.get_locations.return_value = []
-        mock_get_service.return_value = mock_service
+        mock_db_service.get_locations.return_value = []
 
         response = client.get("/db/locations?device_id=iphone")
 
         assert response.status_code == 200
-        mock_service.get_locations.assert_called_once()
-        call_kwargs = mock_service.get_locations.call_args[1]
+        mock_db_service.get_locations.assert_called_once()
+        call_kwargs = mock_db_service.get_locations.call_args[1]
         assert call_kwargs["device_id"] == "iphone"
 
-    @patch("app.blueprints.database._get_or_init_db_service")
-    def test_db_locations_invalid_limit(
-        self, mock_get_service: MagicMock, client: FlaskClient
-    ) -> None:
+    def test_db_locations_invalid_limit(self, client: FlaskClient) -> None:
         """Test that /db/locations returns 400 for invalid limit."""
         response = client.get("/db/locations?limit=invalid")
 
@@ -148,10 +147,7 @@ class TestDatabaseLocationsEndpoint:
         assert data["status"] == "error"
         assert "Invalid limit or offset" in data["error"]
 
-    @patch("app.blueprints.database._get_or_init_db_service")
-    def test_db_locations_negative_offset(
-        self, mock_get_service: MagicMock, client: FlaskClient
-    ) -> None:
+    def test_db_locations_negative_offset(self, client: FlaskClient) -> None:
         """Test that /db/locations returns 400 for negative offset."""
         response = client.get("/db/locations?offset=-5")
 
@@ -159,28 +155,22 @@ class TestDatabaseLocationsEndpoint:
         data = response.get_json()
         assert data["status"] == "error"
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_locations_caps_limit_at_100(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_db_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that /db/locations caps limit at 100."""
-        mock_service = MagicMock()
-        mock_service.get_locations.return_value = []
-        mock_get_service.return_value = mock_service
+        mock_db_service.get_locations.return_value = []
 
         response = client.get("/db/locations?limit=500")
 
         assert response.status_code == 200
-        mock_service.get_locations.assert_called_once()
-        call_kwargs = mock_service.get_locations.call_args[1]
+        mock_db_service.get_locations.assert_called_once()
+        call_kwargs = mock_db_service.get_locations.call_args[1]
         assert call_kwargs["limit"] == 100
 
-    @patch("app.blueprints.database._get_or_init_db_service")
-    def test_db_locations_error(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_db_locations_error(self, mock_db_service: MagicMock, client: FlaskClient) -> None:
         """Test that /db/locations returns 500 on database error."""
-        mock_service = MagicMock()
-        mock_service.get_locations.side_effect = Exception("Query failed")
-        mock_get_service.return_value = mock_service
+        mock_db_service.get_locations.side_effect = Exception("Query failed")
 
         response = client.get("/db/locations")
 
@@ -189,15 +179,12 @@ class TestDatabaseLocationsEndpoint:
         assert data["status"] == "error"
         assert "trace_id" in data
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_locations_table_not_found(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_db_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that /db/locations returns 404 when table doesn't exist."""
-        mock_service = MagicMock()
         # Simulate PostgreSQL error for missing table
-        mock_service.get_locations.side_effect = Exception('relation "locations" does not exist')
-        mock_get_service.return_value = mock_service
+        mock_db_service.get_locations.side_effect = Exception('relation "locations" does not exist')
 
         response = client.get("/db/locations")
 
@@ -209,14 +196,11 @@ class TestDatabaseLocationsEndpoint:
         assert "database" in data
         assert "trace_id" in data
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_locations_response_format(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_db_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that /db/locations response has correct format."""
-        mock_service = MagicMock()
-        mock_service.get_locations.return_value = []
-        mock_get_service.return_value = mock_service
+        mock_db_service.get_locations.return_value = []
 
         response = client.get("/db/locations")
 
@@ -230,23 +214,25 @@ class TestDatabaseLocationsEndpoint:
         assert "locations" in data
         assert "trace_id" in data
 
-    @patch("app.blueprints.database._get_or_init_db_service")
     def test_db_locations_table_not_found_with_null_config(
-        self, mock_get_service: MagicMock, client: FlaskClient, app: MagicMock
+        self,
+        mock_db_service: MagicMock,
+        client: FlaskClient,
+        app: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that /db/locations returns 'unknown' database when APP_CONFIG is None.
 
         This tests the defensive null handling where current_app.config.get("APP_CONFIG")
         returns None, ensuring the fallback to "unknown" works correctly.
         """
-        mock_service = MagicMock()
         # Simulate PostgreSQL error for missing table
-        mock_service.get_locations.side_effect = Exception('relation "locations" does not exist')
-        mock_get_service.return_value = mock_service
+        mock_db_service.get_locations.side_effect = Exception('relation "locations" does not exist')
 
-        # Set APP_CONFIG to None in the test app context
+        # Null out APP_CONFIG via monkeypatch so the session-scoped app
+        # is restored for subsequent tests.
         with app.app_context():
-            app.config["APP_CONFIG"] = None
+            monkeypatch.setitem(app.config, "APP_CONFIG", None)
 
             response = client.get("/db/locations")
 
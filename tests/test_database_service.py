@@ -11,7 +11,7 @@ from app.config import Config
 from app.services.database import DatabaseService, LocationRecord
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Generator
 
 
 class TestDatabaseService:
@@ -31,16 +31,28 @@ class TestDatabaseService:
             db_connect_timeout=5,
         )
 
+    @pytest.fixture(autouse=True)
+    def mock_pool_class(self) -> Generator[MagicMock, None, None]:
+        """Patch psycopg2's ThreadedConnectionPool for every test.
+
+        One autouse fixture replaces the per-test @patch decorators;
+        tests that need the pool configure mock_pool_class.return_value.
+        """
+        with patch("app.services.database.pool.ThreadedConnectionPool") as mock_cls:
+            yield mock_cls
+
     @pytest.fixture
-    def mock_pool(self) -> MagicMock:
-        """Create a mock connection pool."""
-        pool = MagicMock()
-        conn = MagicMock()
-        cursor = MagicMock()
-        pool.getconn.return_value = conn
-        conn.cursor.return_value.__enter__ = MagicMock(return_value=cursor)
-        conn.cursor.return_value.__exit__ = MagicMock(return_value=None)
-        return pool
+    def mock_db(self, mock_pool_class: MagicMock) -> tuple[MagicMock, MagicMock, MagicMock]:
+        """Return the (pool, connection, cursor) mock graph.
+
+        MagicMock auto-wires context-manager magic methods, so the cursor
+        is reachable through conn.cursor()'s __enter__; building the chain
+        once here replaces the duplicated setup block every test carried.
+        """
+        pool = mock_pool_class.return_value
+        conn = pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        return pool, conn, cursor
 
     def test_init_sets_config(self, mock_config: Config) -> None:
         """Test that initialization stores config."""
@@ -48,7 +60,6 @@ class TestDatabaseService:
         assert service._config == mock_config
         assert service._pool is None
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_initialize_creates_pool(self, mock_pool_class: MagicMock, mock_config: Config) -> None:
         """Test that initialize creates a connection pool."""
         service = DatabaseService(mock_config)
@@ -63,8 +74,22 @@ class TestDatabaseService:
             user="test_user",
             password="test_password",  # pragma: allowlist secret
             connect_timeout=5,
+            keepalives=1,
+            keepalives_idle=30,
         )
 
+    def test_initialize_warms_pool(
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
+    ) -> None:
+        """Test that initialize warms the minimum-pool connections."""
+        mock_pool, mock_conn, mock_cursor = mock_db
+
+        service = DatabaseService(mock_config)
+        service.initialize()
+
+        mock_cursor.execute.assert_called_with("SELECT 1")
+        mock_pool.putconn.assert_called_with(mock_conn)
+
     def test_initialize_without_credentials(self) -> None:
         """Test that initialize fails without credentials."""
         config = Config(db_user=None, db_password=None)
@@ -73,11 +98,11 @@ class TestDatabaseService:
         with pytest.raises(RuntimeError, match="Database credentials not configured"):
             service.initialize()
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
-    def test_close_closes_pool(self, mock_pool_class: MagicMock, mock_config: Config) -> None:
+    def test_close_closes_pool(
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
+    ) -> None:
         """Test that close closes all connections."""
-        mock_pool = MagicMock()
-        mock_pool_class.return_value = mock_pool
+        mock_pool, _, _ = mock_db
 
         service = DatabaseService(mock_config)
         service.initialize()
@@ -91,18 +116,15 @@ class TestDatabaseService:
         service = DatabaseService(mock_config)
         service.close()  # Should not raise
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_get_connection_returns_connection(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that get_connection returns a connection from pool."""
-        mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_pool.getconn.return_value = mock_conn
-        mock_pool_class.return_value = mock_pool
+        mock_pool, mock_conn, _ = mock_db
 
         service = DatabaseService(mock_config)
         service.initialize()
+        mock_pool.reset_mock()  # drop warm-up calls
 
         with service.get_connection() as conn:
             assert conn == mock_conn
@@ -111,18 +133,15 @@ class TestDatabaseService:
         mock_conn.commit.assert_called_once()
         mock_pool.putconn.assert_called_once_with(mock_conn)
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_get_connection_rollback_on_error(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that get_connection rollbacks on exception."""
-        mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_pool.getconn.return_value = mock_conn
-        mock_pool_class.return_value = mock_pool
+        mock_pool, mock_conn, _ = mock_db
 
         service = DatabaseService(mock_config)
         service.initialize()
+        mock_pool.reset_mock()  # drop warm-up calls
 
         # Test that exceptions trigger rollback
         with pytest.raises(ValueError, match="Test error"), service.get_connection():
@@ -141,19 +160,12 @@ class TestDatabaseService:
         ):
             pass
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_health_check_returns_status(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that health_check returns connection status."""
-        mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_pool.getconn.return_value = mock_conn
-        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=None)
+        _, _, mock_cursor = mock_db
         mock_cursor.fetchone.return_value = ["PostgreSQL 14.0"]
-        mock_pool_class.return_value = mock_pool
 
         service = DatabaseService(mock_config)
         service.initialize()
@@ -165,17 +177,11 @@ class TestDatabaseService:
         assert result["port"] == 5432
         assert result["server_version"] == "PostgreSQL 14.0"
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_get_locations_returns_records(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that get_locations returns location records."""
-        mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_pool.getconn.return_value = mock_conn
-        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=None)
+        _, _, mock_cursor = mock_db
 
         # Mock database rows
         from datetime import datetime
@@ -216,7 +222,6 @@ class TestDatabaseService:
                 '{"test": "data2"}',
             ),
         ]
-        mock_pool_class.return_value = mock_pool
 
         service = DatabaseService(mock_config)
         service.initialize()
@@ -229,19 +234,12 @@ class TestDatabaseService:
         assert locations[0].longitude == -74.0060
         assert locations[1].battery == 80
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_get_locations_with_device_filter(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that get_locations filters by device_id."""
-        mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_pool.getconn.return_value = mock_conn
-        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=None)
+        _, _, mock_cursor = mock_db
         mock_cursor.fetchall.return_value = []
-        mock_pool_class.return_value = mock_pool
 
         service = DatabaseService(mock_config)
         service.initialize()
@@ -252,19 +250,12 @@ class TestDatabaseService:
         assert "device_id = %s" in call_args[0][0]
         assert call_args[0][1][0] == "iphone"
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_get_locations_limits_max_100(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that get_locations caps limit at 100."""
-        mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_pool.getconn.return_value = mock_conn
-        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=None)
+        _, _, mock_cursor = mock_db
         mock_cursor.fetchall.return_value = []
-        mock_pool_class.return_value = mock_pool
 
         service = DatabaseService(mock_config)
         service.initialize()
@@ -274,19 +265,12 @@ class TestDatabaseService:
         call_args = mock_cursor.execute.call_args
         assert 100 in call_args[0][1]  # limit should be 100
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_get_locations_sanitizes_sort(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that get_locations sanitizes sort column."""
-        mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_pool.getconn.return_value = mock_conn
-        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=None)
+        _, _, mock_cursor = mock_db
         mock_cursor.fetchall.return_value = []
-        mock_pool_class.return_value = mock_pool
 
         service = DatabaseService(mock_config)
         service.initialize()
@@ -296,7 +280,6 @@ class TestDatabaseService:
         call_args = mock_cursor.execute.call_args
         assert "ORDER BY created_at" in call_args[0][0]
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_initialize_fail_fast_on_connection_error(
         self, mock_pool_class: MagicMock, mock_config: Config
     ) -> None:
@@ -312,15 +295,13 @@ class TestDatabaseService:
         with pytest.raises(OperationalError, match="Connection refused"):
             service.initialize()
 
-    @patch("app.services.database.pool.ThreadedConnectionPool")
     def test_close_db_service_function(
-        self, mock_pool_class: MagicMock, mock_config: Config
+        self, mock_db: tuple[MagicMock, MagicMock, MagicMock], mock_config: Config
     ) -> None:
         """Test that close_db_service closes the global database pool."""
         from app.services import database
 
-        mock_pool = MagicMock()
-        mock_pool_class.return_value = mock_pool
+        mock_pool, _, _ = mock_db
 
         # Initialize the global service
         service = DatabaseService(mock_config)
@@ -347,6 +328,11 @@ class TestDatabaseService:
 class TestLocationRecord:
     """Test cases for LocationRecord dataclass."""
 
+    def test_is_slotted(self) -> None:
+        """Lock in the slots optimization: no per-instance __dict__."""
+        assert hasattr(LocationRecord, "__slots__")
+        assert "__dict__" not in LocationRecord.__slots__
+
     def test_to_dict(self) -> None:
         """Test LocationRecord serialization."""
         record = LocationRecord(
@@ -9,57 +9,86 @@ Tests cover:
 """
 
 from datetime import datetime, timedelta
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app import create_app
-from app.config import Config
-from app.proto.distance.v1.distance_pb2 import (
-    CalculateDistanceResponse,
-    GetJobStatusResponse,
-    ListJobsResponse,
+from app.services.distance_client import (
+    DistanceClient,
+    ServiceUnavailableError,
+    ValidationError,
 )
-from app.services.distance_client import ServiceUnavailableError, ValidationError
 
+# Skip cleanly (instead of erroring at collection) when the generated
+# protobuf module is absent, e.g. before buf generate has run.
+distance_pb2 = pytest.importorskip("app.proto.distance.v1.distance_pb2")
 
-@pytest.fixture
-def test_config():
-    """Create test configuration."""
-    return Config(
-        port=8080,
-        data_dir=Path("/tmp/test_data"),
-        otel_endpoint="localhost:4317",
-        service_name="otel-demo-test",
-        distance_service_endpoint="localhost:50051",
-        distance_service_timeout=30,
-    )
+# The app/client fixtures come from tests/conftest.py; the session-scoped
+# app there carries the default distance service endpoint/timeout this
+# file relies on (localhost:50051, 30s).
 
+# Fixed request bodies shared across tests; only tests exercising a
+# specific field build their own dict.
+_VALID_BODY = {"date": "2026-01-25", "device_id": "iphone_stuart"}
+_VALID_BODY_ALL = {"date": "2026-01-25"}
 
-@pytest.fixture
-def app(test_config):
-    """Create Flask app in test mode."""
-    app = create_app(test_config)
-    app.config["TESTING"] = True
-    return app
 
+def _make_list_jobs_response(count, *, status="completed", device_id="iphone", total=100, start=0):
+    """Build a ListJobsResponse with `count` uniform job summaries.
 
-@pytest.fixture
-def client(app):
-    """Create Flask test client."""
-    return app.test_client()
+    Centralizes the jobs.add() loops the list-jobs tests all repeated;
+    job ids run job-<start> .. job-<start + count - 1>.
+    """
+    response = distance_pb2.ListJobsResponse()
+    response.total_count = total
+    if count:
+        # Build the shared fields once and clone, instead of crossing the
+        # Python/C protobuf boundary per field per job; only job_id varies.
+        template = distance_pb2.JobSummary(status=status, date="2026-01-25", device_id=device_id)
+        template.queued_at.GetCurrentTime()
+        if status == "completed":
+            template.completed_at.GetCurrentTime()
+        jobs = [distance_pb2.JobSummary() for _ in range(count)]
+        for i, job in enumerate(jobs):
+            job.CopyFrom(template)
+            job.job_id = f"job-{start + i}"
+        response.jobs.extend(jobs)
+    return response
 
 
 @pytest.fixture
 def mock_distance_client():
-    """Mock DistanceClient for testing."""
+    """Mock DistanceClient for testing.
+
+    spec_set pins the mock to DistanceClient's real API: attribute
+    lookups hit a fixed child-mock set instead of auto-creating mocks
+    on the fly, and a typo'd method name fails loudly instead of
+    silently recording calls.
+    """
     with patch("app.blueprints.distance.get_distance_client") as mock:
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec_set=DistanceClient)
         mock.return_value = mock_client
         yield mock_client
 
 
+@pytest.fixture
+def mock_worker_download():
+    """Mock the HTTP proxy request to otel-worker's /download endpoint.
+
+    The download endpoint streams CSVs from the worker over HTTP; mocking
+    requests.get keeps these tests fully in memory — no real connections,
+    no files on a shared /tmp path, no syscalls per test.
+    """
+    with patch("app.blueprints.distance.requests.get") as mock_get:
+        response = MagicMock()
+        response.status_code = 200
+        response.iter_content.return_value = iter(
+            [b"timestamp,device_id,latitude,longitude,distance_from_home_km\n"]
+        )
+        mock_get.return_value = response
+        yield mock_get
+
+
 # =============================================================================
 # POST /api/distance/calculate Tests
 # =============================================================================
@@ -71,7 +100,7 @@ class TestCalculateDistance:
     def test_calculate_distance_success(self, client, mock_distance_client):
         """Test successful distance calculation request."""
         # Mock response
-        response = CalculateDistanceResponse()
+        response = distance_pb2.CalculateDistanceResponse()
         response.job_id = "test-job-id"
         response.status = "queued"
         response.queued_at.GetCurrentTime()
@@ -79,10 +108,7 @@ class TestCalculateDistance:
         mock_distance_client.calculate_distance.return_value = response
 
         # Make request
-        resp = client.post(
-            "/api/distance/calculate",
-            json={"date": "2026-01-25", "device_id": "iphone_stuart"},
-        )
+        resp = client.post("/api/distance/calculate", json=_VALID_BODY)
 
         # Assertions
         assert resp.status_code == 202
@@ -99,14 +125,14 @@ class TestCalculateDistance:
 
     def test_calculate_distance_all_devices(self, client, mock_distance_client):
         """Test distance calculation for all devices (no device_id)."""
-        response = CalculateDistanceResponse()
+        response = distance_pb2.CalculateDistanceResponse()
         response.job_id = "test-job-id-all"
         response.status = "queued"
         response.queued_at.GetCurrentTime()
 
         mock_distance_client.calculate_distance.return_value = response
 
-        resp = client.post("/api/distance/calculate", json={"date": "2026-01-25"})
+        resp = client.post("/api/distance/calculate", json=_VALID_BODY_ALL)
 
         assert resp.status_code == 202
         data = resp.get_json()
@@ -134,6 +160,15 @@ class TestCalculateDistance:
         assert data["error"]["code"] == "VALIDATION_ERROR"
         assert "format" in data["error"]["message"].lower()
 
+    def test_calculate_distance_non_ascii_date(self, client, mock_distance_client):
+        """Test that non-ASCII digits are rejected, not forwarded."""
+        resp = client.post("/api/distance/calculate", json={"date": "٢٠٢٦-٠١-٢٥"})
+
+        assert resp.status_code == 400
+        data = resp.get_json()
+        assert data["error"]["code"] == "VALIDATION_ERROR"
+        mock_distance_client.calculate_distance.assert_not_called()
+
     def test_calculate_distance_future_date(self, client, mock_distance_client):
         """Test request with future date."""
         future_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
@@ -164,28 +199,6 @@ class TestCalculateDistance:
         assert data["error"]["code"] == "VALIDATION_ERROR"
         assert "json" in data["error"]["message"].lower()
 
-    def test_calculate_distance_service_unavailable(self, client, mock_distance_client):
-        """Test service unavailable error."""
-        mock_distance_client.calculate_distance.side_effect = ServiceUnavailableError(
-            "Service unavailable"
-        )
-
-        resp = client.post("/api/distance/calculate", json={"date": "2026-01-25"})
-
-        assert resp.status_code == 503
-        data = resp.get_json()
-        assert data["error"]["code"] == "SERVICE_UNAVAILABLE"
-
-    def test_calculate_distance_validation_error(self, client, mock_distance_client):
-        """Test validation error from service."""
-        mock_distance_client.calculate_distance.side_effect = ValidationError("Invalid date")
-
-        resp = client.post("/api/distance/calculate", json={"date": "2026-01-25"})
-
-        assert resp.status_code == 400
-        data = resp.get_json()
-        assert data["error"]["code"] == "VALIDATION_ERROR"
-
 
 # =============================================================================
 # GET /api/distance/jobs/<job_id> Tests
@@ -197,7 +210,7 @@ class TestGetJobStatus:
 
     def test_get_job_status_queued(self, client, mock_distance_client):
         """Test retrieving queued job status."""
-        response = GetJobStatusResponse()
+        response = distance_pb2.GetJobStatusResponse()
         response.job_id = "test-job-id"
         response.status = "queued"
         response.queued_at.GetCurrentTime()
@@ -217,7 +230,7 @@ class TestGetJobStatus:
 
     def test_get_job_status_processing(self, client, mock_distance_client):
         """Test retrieving processing job status."""
-        response = GetJobStatusResponse()
+        response = distance_pb2.GetJobStatusResponse()
         response.job_id = "test-job-id"
         response.status = "processing"
         response.queued_at.GetCurrentTime()
@@ -235,7 +248,7 @@ class TestGetJobStatus:
 
     def test_get_job_status_completed(self, client, mock_distance_client):
         """Test retrieving completed job with results."""
-        response = GetJobStatusResponse()
+        response = distance_pb2.GetJobStatusResponse()
         response.job_id = "test-job-id"
         response.status = "completed"
         response.queued_at.GetCurrentTime()
@@ -268,7 +281,7 @@ class TestGetJobStatus:
 
     def test_get_job_status_failed(self, client, mock_distance_client):
         """Test retrieving failed job with error."""
-        response = GetJobStatusResponse()
+        response = distance_pb2.GetJobStatusResponse()
         response.job_id = "test-job-id"
         response.status = "failed"
         response.queued_at.GetCurrentTime()
@@ -286,28 +299,6 @@ class TestGetJobStatus:
         assert data["error_message"] == "Database connection failed"
         assert "result" not in data
 
-    def test_get_job_status_not_found(self, client, mock_distance_client):
-        """Test job not found error."""
-        mock_distance_client.get_job_status.side_effect = ValidationError("Job not found")
-
-        resp = client.get("/api/distance/jobs/nonexistent-job-id")
-
-        assert resp.status_code == 404
-        data = resp.get_json()
-        assert data["error"]["code"] == "NOT_FOUND"
-
-    def test_get_job_status_service_unavailable(self, client, mock_distance_client):
-        """Test service unavailable error."""
-        mock_distance_client.get_job_status.side_effect = ServiceUnavailableError(
-            "Service unavailable"
-        )
-
-        resp = client.get("/api/distance/jobs/test-job-id")
-
-        assert resp.status_code == 503
-        data = resp.get_json()
-        assert data["error"]["code"] == "SERVICE_UNAVAILABLE"
-
 
 # =============================================================================
 # GET /api/distance/jobs Tests
@@ -319,19 +310,9 @@ class TestListJobs:
 
     def test_list_jobs_no_filters(self, client, mock_distance_client):
         """Test listing all jobs without filters."""
-        response = ListJobsResponse()
-        response.total_count = 100
-
-        for i in range(3):
-            job = response.jobs.add()
-            job.job_id = f"job-{i}"
-            job.status = "completed"
-            job.date = "2026-01-25"
-            job.device_id = "iphone_stuart"
-            job.queued_at.GetCurrentTime()
-            job.completed_at.GetCurrentTime()
-
-        mock_distance_client.list_jobs.return_value = response
+        mock_distance_client.list_jobs.return_value = _make_list_jobs_response(
+            3, device_id="iphone_stuart"
+        )
 
         resp = client.get("/api/distance/jobs")
 
@@ -348,18 +329,9 @@ class TestListJobs:
 
     def test_list_jobs_with_status_filter(self, client, mock_distance_client):
         """Test listing jobs filtered by status."""
-        response = ListJobsResponse()
-        response.total_count = 10
-
-        for i in range(2):
-            job = response.jobs.add()
-            job.job_id = f"job-{i}"
-            job.status = "queued"
-            job.date = "2026-01-25"
-            job.device_id = ""
-            job.queued_at.GetCurrentTime()
-
-        mock_distance_client.list_jobs.return_value = response
+        mock_distance_client.list_jobs.return_value = _make_list_jobs_response(
+            2, status="queued", device_id="", total=10
+        )
 
         resp = client.get("/api/distance/jobs?status=queued")
 
@@ -373,18 +345,7 @@ class TestListJobs:
 
     def test_list_jobs_with_pagination(self, client, mock_distance_client):
         """Test pagination with limit and offset."""
-        response = ListJobsResponse()
-        response.total_count = 100
-
-        for i in range(10):
-            job = response.jobs.add()
-            job.job_id = f"job-{i + 20}"
-            job.status = "completed"
-            job.date = "2026-01-25"
-            job.device_id = "iphone"
-            job.queued_at.GetCurrentTime()
-
-        mock_distance_client.list_jobs.return_value = response
+        mock_distance_client.list_jobs.return_value = _make_list_jobs_response(10, start=20)
 
         resp = client.get("/api/distance/jobs?limit=10&offset=20")
 
@@ -398,18 +359,9 @@ class TestListJobs:
 
     def test_list_jobs_last_page(self, client, mock_distance_client):
         """Test last page with no next_offset."""
-        response = ListJobsResponse()
-        response.total_count = 15
-
-        for i in range(5):
-            job = response.jobs.add()
-            job.job_id = f"job-{i + 10}"
-            job.status = "completed"
-            job.date = "2026-01-25"
-            job.device_id = "iphone"
-            job.queued_at.GetCurrentTime()
-
-        mock_distance_client.list_jobs.return_value = response
+        mock_distance_client.list_jobs.return_value = _make_list_jobs_response(
+            5, total=15, start=10
+        )
 
         resp = client.get("/api/distance/jobs?limit=10&offset=10")
 
@@ -419,10 +371,7 @@ class TestListJobs:
 
     def test_list_jobs_with_date_filter(self, client, mock_distance_client):
         """Test filtering by date."""
-        response = ListJobsResponse()
-        response.total_count = 5
-
-        mock_distance_client.list_jobs.return_value = response
+        mock_distance_client.list_jobs.return_value = _make_list_jobs_response(0, total=5)
 
         resp = client.get("/api/distance/jobs?date=2026-01-25")
 
@@ -431,40 +380,30 @@ class TestListJobs:
 
     def test_list_jobs_with_device_filter(self, client, mock_distance_client):
         """Test filtering by device_id."""
-        response = ListJobsResponse()
-        response.total_count = 3
-
-        mock_distance_client.list_jobs.return_value = response
+        mock_distance_client.list_jobs.return_value = _make_list_jobs_response(0, total=3)
 
         resp = client.get("/api/distance/jobs?device_id=iphone_stuart")
 
         assert resp.status_code == 200
         mock_distance_client.list_jobs.assert_called_once_with("", 50, 0, "", "iphone_stuart")
 
-    def test_list_jobs_invalid_limit_too_high(self, client, mock_distance_client):
-        """Test limit exceeding maximum."""
-        resp = client.get("/api/distance/jobs?limit=1000")
-
-        assert resp.status_code == 400
-        data = resp.get_json()
-        assert data["error"]["code"] == "VALIDATION_ERROR"
-        assert "limit" in data["error"]["message"].lower()
-
-    def test_list_jobs_invalid_limit_too_low(self, client, mock_distance_client):
-        """Test limit less than minimum."""
-        resp = client.get("/api/distance/jobs?limit=0")
-
-        assert resp.status_code == 400
-        data = resp.get_json()
-        assert data["error"]["code"] == "VALIDATION_ERROR"
-
-    def test_list_jobs_invalid_offset(self, client, mock_distance_client):
-        """Test negative offset."""
-        resp = client.get("/api/distance/jobs?offset=-1")
+    @pytest.mark.parametrize(
+        ("query", "expected_fragment"),
+        [
+            pytest.param("limit=1000", "limit", id="limit-too-high"),
+            pytest.param("limit=0", "limit", id="limit-too-low"),
+            pytest.param("offset=-1", None, id="negative-offset"),
+        ],
+    )
+    def test_list_jobs_invalid_pagination(self, client, query, expected_fragment):
+        """Out-of-range limit/offset values are rejected."""
+        resp = client.get(f"/api/distance/jobs?{query}")
 
         assert resp.status_code == 400
         data = resp.get_json()
         assert data["error"]["code"] == "VALIDATION_ERROR"
+        if expected_fragment:
+            assert expected_fragment in data["error"]["message"].lower()
 
     def test_list_jobs_invalid_status(self, client, mock_distance_client):
         """Test invalid status value."""
@@ -484,15 +423,80 @@ class TestListJobs:
         assert data["error"]["code"] == "VALIDATION_ERROR"
         assert "date" in data["error"]["message"].lower()
 
-    def test_list_jobs_service_unavailable(self, client, mock_distance_client):
-        """Test service unavailable error."""
-        mock_distance_client.list_jobs.side_effect = ServiceUnavailableError("Service unavailable")
 
-        resp = client.get("/api/distance/jobs")
+# =============================================================================
+# Service error mapping Tests
+# =============================================================================
 
-        assert resp.status_code == 503
-        data = resp.get_json()
-        assert data["error"]["code"] == "SERVICE_UNAVAILABLE"
+
+class TestServiceErrorMapping:
+    """Errors raised by DistanceClient map uniformly onto HTTP responses."""
+
+    @pytest.mark.parametrize(
+        ("method_name", "verb", "url", "kwargs", "exc", "status", "code"),
+        [
+            pytest.param(
+                "calculate_distance",
+                "post",
+                "/api/distance/calculate",
+                {"json": _VALID_BODY_ALL},
+                ServiceUnavailableError("Service unavailable"),
+                503,
+                "SERVICE_UNAVAILABLE",
+                id="calculate-unavailable",
+            ),
+            pytest.param(
+                "calculate_distance",
+                "post",
+                "/api/distance/calculate",
+                {"json": _VALID_BODY_ALL},
+                ValidationError("Invalid date"),
+                400,
+                "VALIDATION_ERROR",
+                id="calculate-validation",
+            ),
+            pytest.param(
+                "get_job_status",
+                "get",
+                "/api/distance/jobs/nonexistent-job-id",
+                {},
+                ValidationError("Job not found"),
+                404,
+                "NOT_FOUND",
+                id="job-status-not-found",
+            ),
+            pytest.param(
+                "get_job_status",
+                "get",
+                "/api/distance/jobs/test-job-id",
+                {},
+                ServiceUnavailableError("Service unavailable"),
+                503,
+                "SERVICE_UNAVAILABLE",
+                id="job-status-unavailable",
+            ),
+            pytest.param(
+                "list_jobs",
+                "get",
+                "/api/distance/jobs",
+                {},
+                ServiceUnavailableError("Service unavailable"),
+                503,
+                "SERVICE_UNAVAILABLE",
+                id="list-jobs-unavailable",
+            ),
+        ],
+    )
+    def test_service_error_mapping(
+        self, client, mock_distance_client, method_name, verb, url, kwargs, exc, status, code
+    ):
+        """Each client-raised error becomes the expected status and error code."""
+        getattr(mock_distance_client, method_name).side_effect = exc
+
+        resp = getattr(client, verb)(url, **kwargs)
+
+        assert resp.status_code == status
+        assert resp.get_json()["error"]["code"] == code
 
 
 # =============================================================================
@@ -503,89 +507,72 @@ class TestListJobs:
 class TestDownloadCSV:
     """Tests for GET /api/distance/download/<filename> endpoint."""
 
-    def test_download_csv_success(self, client, tmp_path):
-        """Test successful CSV download."""
-        # The test config uses /tmp/test_data, so create the file there
-        csv_dir = Path("/tmp/test_data/csv")
-        csv_dir.mkdir(parents=True, exist_ok=True)
-        csv_file = csv_dir / "distance_20260125_iphone_stuart.csv"
-        csv_file.write_text("timestamp,device_id,latitude,longitude,distance_from_home_km\n")
+    def test_download_csv_success(self, client, mock_worker_download):
+        """Test successful CSV download proxied from the worker."""
+        resp = client.get("/api/distance/download/distance_20260125_iphone_stuart.csv")
 
-        try:
-            resp = client.get("/api/distance/download/distance_20260125_iphone_stuart.csv")
+        assert resp.status_code == 200
+        assert resp.mimetype == "text/csv"
+        assert "attachment" in resp.headers.get("Content-Disposition", "")
+        assert b"timestamp" in resp.data
 
-            assert resp.status_code == 200
-            assert resp.mimetype == "text/csv"
-            assert "attachment" in resp.headers.get("Content-Disposition", "")
-        finally:
-            # Cleanup
-            if csv_file.exists():
-                csv_file.unlink()
+        # The request was proxied to the worker's /download endpoint
+        worker_url = mock_worker_download.call_args[0][0]
+        assert worker_url.endswith("/download/distance_20260125_iphone_stuart.csv")
+
+    def test_download_csv_conditional_304(self, client, mock_worker_download):
+        """Test that If-None-Match is forwarded and a worker 304 passes through."""
+        mock_worker_download.return_value.status_code = 304
+
+        resp = client.get(
+            "/api/distance/download/distance_20260125.csv",
+            headers={"If-None-Match": 'W/"abc"'},
+        )
+
+        assert resp.status_code == 304
+        assert resp.data == b""
+        sent_headers = mock_worker_download.call_args[1]["headers"]
+        assert sent_headers["If-None-Match"] == 'W/"abc"'
 
-    def test_download_csv_file_not_found(self, client, tmp_path):
+    def test_download_csv_file_not_found(self, client, mock_worker_download):
         """Test file not found error."""
-        # File doesn't exist
+        # Worker reports the file does not exist
+        mock_worker_download.return_value.status_code = 404
+
         resp = client.get("/api/distance/download/distance_20260125_nonexistent.csv")
 
         assert resp.status_code == 404
         data = resp.get_json()
         assert data["error"]["code"] == "NOT_FOUND"
 
-    def test_download_csv_invalid_prefix(self, client, mock_distance_client):
-        """Test filename without distance_ prefix."""
-        resp = client.get("/api/distance/download/invalid_20260125.csv")
+    @pytest.mark.parametrize(
+        ("filename", "expected_fragment"),
+        [
+            pytest.param("invalid_20260125.csv", "distance_", id="missing-prefix"),
+            pytest.param("distance_20260125.txt", ".csv", id="missing-extension"),
+            pytest.param("distance_..test.csv", "traversal", id="path-traversal-dotdot"),
+            pytest.param("distance_test\\test.csv", None, id="path-traversal-backslash"),
+        ],
+    )
+    def test_download_csv_validation_error(self, client, filename, expected_fragment):
+        """Invalid filenames are rejected before any request reaches the worker."""
+        resp = client.get(f"/api/distance/download/{filename}")
 
         assert resp.status_code == 400
         data = resp.get_json()
         assert data["error"]["code"] == "VALIDATION_ERROR"
-        assert "distance_" in data["error"]["message"]
+        if expected_fragment:
+            assert expected_fragment in data["error"]["message"].lower()
 
-    def test_download_csv_invalid_extension(self, client, mock_distance_client):
-        """Test filename without .csv extension."""
-        resp = client.get("/api/distance/download/distance_20260125.txt")
-
-        assert resp.status_code == 400
-        data = resp.get_json()
-        assert data["error"]["code"] == "VALIDATION_ERROR"
-        assert ".csv" in data["error"]["message"]
+    def test_download_csv_worker_error(self, client, mock_worker_download):
+        """Test that a non-200 worker response maps to a download error."""
+        mock_worker_download.return_value.status_code = 500
 
-    def test_download_csv_path_traversal_dotdot(self, client, mock_distance_client):
-        """Test path traversal attempt with ../."""
-        # Use a filename with .. that will be caught by validation
-        resp = client.get("/api/distance/download/distance_..test.csv")
+        resp = client.get("/api/distance/download/distance_20260125.csv")
 
-        assert resp.status_code == 400
+        assert resp.status_code == 500
         data = resp.get_json()
-        assert data["error"]["code"] == "VALIDATION_ERROR"
-        assert "traversal" in data["error"]["message"].lower()
-
-    def test_download_csv_path_traversal_slash(self, client, mock_distance_client):
-        """Test path traversal attempt with  backslash."""
-        # Test with backslash (Windows path separator)
-        resp = client.get("/api/distance/download/distance_test\\test.csv")
-
-        assert resp.status_code == 400
-        data = resp.get_json()
-        assert data["error"]["code"] == "VALIDATION_ERROR"
-
-    def test_download_csv_not_a_file(self, client, tmp_path):
-        """Test when path is a directory, not a file."""
-        # Create a directory with the CSV filename
-        csv_dir = Path("/tmp/test_data/csv")
-        csv_dir.mkdir(parents=True, exist_ok=True)
-        dir_path = csv_dir / "distance_20260125.csv"
-        dir_path.mkdir(exist_ok=True)  # Create directory instead of file
-
-        try:
-            resp = client.get("/api/distance/download/distance_20260125.csv")
-
-            assert resp.status_code == 404
-            data = resp.get_json()
-            assert data["error"]["code"] == "NOT_FOUND"
-        finally:
-            # Cleanup
-            if dir_path.exists() and dir_path.is_dir():
-                dir_path.rmdir()
+        assert data["error"]["code"] == "DOWNLOAD_FAILED"
 
 
 # =============================================================================
@@ -604,7 +591,7 @@ class TestConfigFallbackHandling:
     @patch("app.blueprints.distance.DistanceClient")
     @patch("os.getenv")
     def test_get_distance_client_with_null_config(
-        self, mock_getenv, mock_client_class, client, app
+        self, mock_getenv, mock_client_class, client, app, monkeypatch
     ):
         """Test get_distance_client falls back to env vars when APP_CONFIG is None."""
         # Mock environment variables
@@ -613,12 +600,13 @@ class TestConfigFallbackHandling:
             "DISTANCE_SERVICE_TIMEOUT": "60",
         }.get(key, default)
 
-        # Mock APP_CONFIG to return None within application context
+        # Null out APP_CONFIG via monkeypatch so the session-scoped app
+        # is restored for subsequent tests.
         with app.app_context():
-            app.config["APP_CONFIG"] = None
+            monkeypatch.setitem(app.config, "APP_CONFIG", None)
 
             # Call the endpoint to trigger get_distance_client
-            response = CalculateDistanceResponse()
+            response = distance_pb2.CalculateDistanceResponse()
             response.job_id = "test-job"
             response.status = "queued"
             response.queued_at.GetCurrentTime()
@@ -627,36 +615,25 @@ class TestConfigFallbackHandling:
             mock_client_instance.calculate_distance.return_value = response
             mock_client_class.return_value = mock_client_instance
 
-            resp = client.post("/api/distance/calculate", json={"date": "2026-01-25"})
+            resp = client.post("/api/distance/calculate", json=_VALID_BODY_ALL)
 
             # Verify fallback was used
             assert resp.status_code == 202
             mock_client_class.assert_called_once_with("fallback-host:50051", 60)
 
-    @patch("os.getenv")
-    def test_download_csv_with_null_config_fallback(self, mock_getenv, client, app, tmp_path):
-        """Test CSV download uses env var fallback when APP_CONFIG is None."""
-        # Create test file in fallback location
-        csv_dir = tmp_path / "fallback_csv"
-        csv_dir.mkdir()
-        csv_file = csv_dir / "distance_20260125.csv"
-        csv_file.write_text("test,data\n")
-
-        # Mock environment variables
-        mock_getenv.side_effect = lambda key, default=None: {
-            "CSV_STORAGE_PATH": str(csv_dir),
-        }.get(key, default)
-
-        # Mock APP_CONFIG to return None in the actual request context
+    def test_download_csv_with_null_config_fallback(
+        self, client, app, mock_worker_download, monkeypatch
+    ):
+        """Test CSV download falls back to the cluster-local worker URL."""
+        # Null out APP_CONFIG via monkeypatch so the session-scoped app
+        # is restored for subsequent tests.
         with app.app_context():
-            app.config["APP_CONFIG"] = None
+            monkeypatch.setitem(app.config, "APP_CONFIG", None)
 
             resp = client.get("/api/distance/download/distance_20260125.csv")
 
-            # Should successfully download from fallback path
+            # Download succeeds via the default cluster-local worker URL
             assert resp.status_code == 200
             assert resp.mimetype == "text/csv"
-
-        # Cleanup
-        if csv_file.exists():
-            csv_file.unlink()
+            worker_url = mock_worker_download.call_args[0][0]
+            assert worker_url.startswith("http://otel-worker.otel-worker.svc.cluster.local:8080/")
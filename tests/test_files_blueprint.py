@@ -5,30 +5,48 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from app.services.storage import (
     DirectoryNotEmptyError,
     FileInfo,
     InvalidPathError,
     PathNotFoundError,
+    StorageService,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from flask.testing import FlaskClient
 
 
+@pytest.fixture(autouse=True)
+def mock_storage_service() -> Generator[MagicMock, None, None]:
+    """Patch the blueprint's service accessor once per test.
+
+    Every test in this module talks to a mocked StorageService, so a
+    single autouse fixture replaces the per-test @patch decorators;
+    tests configure return values/side effects on the yielded mock.
+    """
+    with patch("app.blueprints.files._get_or_init_storage_service") as mock_get:
+        # spec_set fails fast on typo'd attributes instead of minting
+        # open-ended child mocks
+        service = MagicMock(spec_set=StorageService)
+        mock_get.return_value = service
+        yield service
+
+
 class TestFilesGetEndpoint:
     """Test cases for GET /files endpoints."""
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_get_root_directory(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_get_root_directory(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test listing root directory."""
-        mock_service = MagicMock()
-        mock_service.is_directory.return_value = True
-        mock_service.list_directory.return_value = [
+        mock_storage_service.probe.return_value = ("directory", 0)
+        mock_storage_service.list_directory.return_value = [
             FileInfo(name="file1.txt", type="file", size=100),
             FileInfo(name="subdir", type="directory"),
         ]
-        mock_get_service.return_value = mock_service
 
         response = client.get("/files/")
 
@@ -38,15 +56,12 @@ class TestFilesGetEndpoint:
         assert len(data["items"]) == 2
         assert "trace_id" in data
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_get_subdirectory(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_get_subdirectory(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test listing a subdirectory."""
-        mock_service = MagicMock()
-        mock_service.is_directory.return_value = True
-        mock_service.list_directory.return_value = [
+        mock_storage_service.probe.return_value = ("directory", 0)
+        mock_storage_service.list_directory.return_value = [
             FileInfo(name="nested.txt", type="file", size=50),
         ]
-        mock_get_service.return_value = mock_service
 
         response = client.get("/files/subdir")
 
@@ -55,13 +70,10 @@ class TestFilesGetEndpoint:
         assert data["path"] == "subdir"
         assert data["type"] == "directory"
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_get_file_content(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_get_file_content(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test reading file content."""
-        mock_service = MagicMock()
-        mock_service.is_directory.return_value = False
-        mock_service.read_file.return_value = ("Hello World", 11)
-        mock_get_service.return_value = mock_service
+        mock_storage_service.probe.return_value = ("file", 11)
+        mock_storage_service.read_file.return_value = ("Hello World", 11)
 
         response = client.get("/files/test.txt")
 
@@ -71,13 +83,10 @@ class TestFilesGetEndpoint:
         assert data["content"] == "Hello World"
         assert data["size"] == 11
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_get_nested_path(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_get_nested_path(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test reading nested path."""
-        mock_service = MagicMock()
-        mock_service.is_directory.return_value = False
-        mock_service.read_file.return_value = ("Nested content", 14)
-        mock_get_service.return_value = mock_service
+        mock_storage_service.probe.return_value = ("file", 14)
+        mock_storage_service.read_file.return_value = ("Nested content", 14)
 
         response = client.get("/files/subdir/nested.txt")
 
@@ -85,12 +94,9 @@ class TestFilesGetEndpoint:
         data = response.get_json()
         assert data["path"] == "subdir/nested.txt"
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_get_invalid_path(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_get_invalid_path(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test that invalid paths return 400."""
-        mock_service = MagicMock()
-        mock_service.is_directory.side_effect = InvalidPathError("Invalid path")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.probe.side_effect = InvalidPathError("Invalid path")
 
         response = client.get("/files/../etc/passwd")
 
@@ -98,13 +104,9 @@ class TestFilesGetEndpoint:
         data = response.get_json()
         assert "error" in data
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_get_not_found(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_get_not_found(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test that non-existent paths return 404."""
-        mock_service = MagicMock()
-        mock_service.is_directory.return_value = False
-        mock_service.read_file.side_effect = PathNotFoundError("Not found")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.probe.side_effect = PathNotFoundError("Not found")
 
         response = client.get("/files/nonexistent.txt")
 
@@ -116,12 +118,9 @@ class TestFilesGetEndpoint:
 class TestFilesWriteEndpoint:
     """Test cases for POST/PUT /files endpoints."""
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_create_file(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_create_file(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test creating a new file."""
-        mock_service = MagicMock()
-        mock_service.write_file.return_value = ("created", 11)
-        mock_get_service.return_value = mock_service
+        mock_storage_service.write_file.return_value = ("created", 11)
 
         response = client.post(
             "/files/new.txt",
@@ -135,12 +134,9 @@ class TestFilesWriteEndpoint:
         assert data["size"] == 11
         assert "trace_id" in data
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_update_file(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_update_file(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test updating an existing file."""
-        mock_service = MagicMock()
-        mock_service.write_file.return_value = ("updated", 7)
-        mock_get_service.return_value = mock_service
+        mock_storage_service.write_file.return_value = ("updated", 7)
 
         response = client.put(
             "/files/existing.txt",
@@ -152,12 +148,9 @@ class TestFilesWriteEndpoint:
         data = response.get_json()
         assert data["status"] == "updated"
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_write_plain_text(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_write_plain_text(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test writing plain text content."""
-        mock_service = MagicMock()
-        mock_service.write_file.return_value = ("created", 10)
-        mock_get_service.return_value = mock_service
+        mock_storage_service.write_file.return_value = ("created", 10)
 
         response = client.post(
             "/files/plain.txt",
@@ -166,14 +159,16 @@ class TestFilesWriteEndpoint:
         )
 
         assert response.status_code == 201
-        mock_service.write_file.assert_called_once_with("plain.txt", "Plain text")
+        # Tuple compare instead of assert_called_once_with: skips the
+        # signature.bind machinery mock assertions run per call.
+        assert mock_storage_service.write_file.call_count == 1
+        assert mock_storage_service.write_file.call_args.args == ("plain.txt", "Plain text")
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_write_empty_content(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_write_empty_content(
+        self, mock_storage_service: MagicMock, client: FlaskClient
+    ) -> None:
         """Test writing empty content is allowed."""
-        mock_service = MagicMock()
-        mock_service.write_file.return_value = ("created", 0)
-        mock_get_service.return_value = mock_service
+        mock_storage_service.write_file.return_value = ("created", 0)
 
         response = client.post(
             "/files/empty.txt",
@@ -182,14 +177,12 @@ class TestFilesWriteEndpoint:
         )
 
         assert response.status_code == 201
-        mock_service.write_file.assert_called_once_with("empty.txt", "")
+        assert mock_storage_service.write_file.call_count == 1
+        assert mock_storage_service.write_file.call_args.args == ("empty.txt", "")
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_write_invalid_path(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_write_invalid_path(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test that invalid paths return 400."""
-        mock_service = MagicMock()
-        mock_service.write_file.side_effect = InvalidPathError("Invalid path")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.write_file.side_effect = InvalidPathError("Invalid path")
 
         response = client.post(
             "/files/../etc/passwd",
@@ -199,8 +192,7 @@ class TestFilesWriteEndpoint:
 
         assert response.status_code == 400
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_write_invalid_json(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_write_invalid_json(self, client: FlaskClient) -> None:
         """Test that invalid JSON returns 400."""
         response = client.post(
             "/files/test.txt",
@@ -214,12 +206,9 @@ class TestFilesWriteEndpoint:
 class TestFilesDeleteEndpoint:
     """Test cases for DELETE /files endpoints."""
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_delete_file(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_delete_file(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test deleting a file."""
-        mock_service = MagicMock()
-        mock_service.delete.return_value = "file"
-        mock_get_service.return_value = mock_service
+        mock_storage_service.delete.return_value = "file"
 
         response = client.delete("/files/test.txt")
 
@@ -229,12 +218,11 @@ class TestFilesDeleteEndpoint:
         assert data["type"] == "file"
         assert "trace_id" in data
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_delete_empty_directory(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_delete_empty_directory(
+        self, mock_storage_service: MagicMock, client: FlaskClient
+    ) -> None:
         """Test deleting an empty directory."""
-        mock_service = MagicMock()
-        mock_service.delete.return_value = "directory"
-        mock_get_service.return_value = mock_service
+        mock_storage_service.delete.return_value = "directory"
 
         response = client.delete("/files/empty_dir")
 
@@ -242,25 +230,19 @@ class TestFilesDeleteEndpoint:
         data = response.get_json()
         assert data["type"] == "directory"
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_delete_not_found(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_delete_not_found(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test that deleting non-existent path returns 404."""
-        mock_service = MagicMock()
-        mock_service.delete.side_effect = PathNotFoundError("Not found")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.delete.side_effect = PathNotFoundError("Not found")
 
         response = client.delete("/files/nonexistent.txt")
 
         assert response.status_code == 404
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
     def test_delete_non_empty_directory(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_storage_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that deleting non-empty directory returns 400."""
-        mock_service = MagicMock()
-        mock_service.delete.side_effect = DirectoryNotEmptyError("Not empty")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.delete.side_effect = DirectoryNotEmptyError("Not empty")
 
         response = client.delete("/files/populated_dir")
 
@@ -268,14 +250,13 @@ class TestFilesDeleteEndpoint:
         data = response.get_json()
         assert "not empty" in data["error"].lower()
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_delete_invalid_path(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_delete_invalid_path(
+        self, mock_storage_service: MagicMock, client: FlaskClient
+    ) -> None:
         """Test that deleting invalid path returns 400."""
-        mock_service = MagicMock()
-        mock_service.delete.side_effect = InvalidPathError("Invalid path")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.delete.side_effect = InvalidPathError("Invalid path")
 
-        response = client.delete("/files/../etc/passwd")
+        response = client.delete("/files/../important_file")
 
         assert response.status_code == 400
 
@@ -283,12 +264,9 @@ class TestFilesDeleteEndpoint:
 class TestFilesCreateDirectoryEndpoint:
     """Test cases for POST /files (create directory) endpoint."""
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_create_directory(self, mock_get_service: MagicMock, client: FlaskClient) -> None:
+    def test_create_directory(self, mock_storage_service: MagicMock, client: FlaskClient) -> None:
         """Test creating a new directory."""
-        mock_service = MagicMock()
-        mock_service.create_directory.return_value = "created"
-        mock_get_service.return_value = mock_service
+        mock_storage_service.create_directory.return_value = "created"
 
         response = client.post(
             "/files",
@@ -301,14 +279,11 @@ class TestFilesCreateDirectoryEndpoint:
         assert data["status"] == "created"
         assert data["type"] == "directory"
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
     def test_create_directory_exists(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_storage_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test creating existing directory returns 200."""
-        mock_service = MagicMock()
-        mock_service.create_directory.return_value = "exists"
-        mock_get_service.return_value = mock_service
+        mock_storage_service.create_directory.return_value = "exists"
 
         response = client.post(
             "/files",
@@ -320,10 +295,7 @@ class TestFilesCreateDirectoryEndpoint:
         data = response.get_json()
         assert data["status"] == "exists"
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
-    def test_create_directory_missing_path(
-        self, mock_get_service: MagicMock, client: FlaskClient
-    ) -> None:
+    def test_create_directory_missing_path(self, client: FlaskClient) -> None:
         """Test creating directory without path returns 400."""
         response = client.post(
             "/files",
@@ -351,32 +323,29 @@ class TestFilesCreateDirectoryEndpoint:
 class TestPathTraversalSecurity:
     """Security tests for path traversal attacks."""
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
+    @pytest.mark.parametrize(
+        "path",
+        [
+            pytest.param("../etc/passwd", id="plain-dotdot"),
+            pytest.param("..%2Fetc%2Fpasswd", id="url-encoded"),
+            pytest.param("subdir/../../etc/passwd", id="nested-dotdot"),
+        ],
+    )
     def test_get_blocks_parent_traversal(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_storage_service: MagicMock, client: FlaskClient, path: str
     ) -> None:
         """Test that GET blocks parent directory traversal."""
-        mock_service = MagicMock()
-        mock_service.is_directory.side_effect = InvalidPathError("Invalid")
-        mock_get_service.return_value = mock_service
-
-        paths = [
-            "../etc/passwd",
-            "..%2Fetc%2Fpasswd",
-            "subdir/../../etc/passwd",
-        ]
-        for path in paths:
-            response = client.get(f"/files/{path}")
-            assert response.status_code in (400, 404), f"Failed for path: {path}"
+        mock_storage_service.probe.side_effect = InvalidPathError("Invalid")
+
+        response = client.get(f"/files/{path}")
+
+        assert response.status_code in (400, 404), f"Failed for path: {path}"
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
     def test_write_blocks_parent_traversal(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_storage_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that POST/PUT blocks parent directory traversal."""
-        mock_service = MagicMock()
-        mock_service.write_file.side_effect = InvalidPathError("Invalid")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.write_file.side_effect = InvalidPathError("Invalid")
 
         response = client.post(
             "/files/../etc/cron.d/malicious",
@@ -385,14 +354,11 @@ class TestPathTraversalSecurity:
         )
         assert response.status_code == 400
 
-    @patch("app.blueprints.files._get_or_init_storage_service")
     def test_delete_blocks_parent_traversal(
-        self, mock_get_service: MagicMock, client: FlaskClient
+        self, mock_storage_service: MagicMock, client: FlaskClient
     ) -> None:
         """Test that DELETE blocks parent directory traversal."""
-        mock_service = MagicMock()
-        mock_service.delete.side_effect = InvalidPathError("Invalid")
-        mock_get_service.return_value = mock_service
+        mock_storage_service.delete.side_effect = InvalidPathError("Invalid")
 
         response = client.delete("/files/../important_file")
         assert response.status_code == 400
@@ -58,7 +58,7 @@ class TestMetricsEndpoint:
         """Test that /metrics returns JSON content type."""
         response = client.get("/metrics")
 
-        assert response.content_type == "application/json"
+        assert response.mimetype == "application/json"
 
     def test_metrics_otel_endpoint_configured(self, client: FlaskClient) -> None:
         """Test that OTEL endpoint is properly configured."""
@@ -27,12 +27,35 @@ class TestStorageService:
         """Create a storage service with a temporary directory."""
         return StorageService(tmp_path)
 
+    @pytest.fixture(scope="module")
+    def populated_tree(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Build the shared test file tree once per module.
+
+        The filesystem writes dominate each populated test's setup cost,
+        so read-only tests share one prebuilt tree. Tests that mutate
+        files use populated_storage_mut instead.
+        """
+        root = tmp_path_factory.mktemp("storage-populated")
+        (root / "file1.txt").write_text("Hello World")
+        (root / "file2.txt").write_text("Test content")
+        (root / "subdir").mkdir()
+        (root / "subdir" / "nested.txt").write_text("Nested file")
+        return root
+
+    @pytest.fixture(scope="module")
+    def populated_storage(self, populated_tree: Path) -> StorageService:
+        """Create one storage service over the shared read-only tree.
+
+        Module-scoped alongside the tree: read-only tests can share the
+        instance (the listing cache is mtime-validated), so repeat
+        listings of the prebuilt tree are served from cache.
+        """
+        return StorageService(populated_tree)
+
     @pytest.fixture
-    def populated_storage(self, temp_storage: StorageService, tmp_path: Path) -> StorageService:
-        """Create a storage service with some test files."""
-        # Create test files and directories
+    def populated_storage_mut(self, temp_storage: StorageService, tmp_path: Path) -> StorageService:
+        """Create a per-test populated tree for tests that mutate files."""
         (tmp_path / "file1.txt").write_text("Hello World")
-        (tmp_path / "file2.txt").write_text("Test content")
         (tmp_path / "subdir").mkdir()
         (tmp_path / "subdir" / "nested.txt").write_text("Nested file")
         return temp_storage
@@ -113,6 +136,32 @@ class TestStorageService:
         with pytest.raises(InvalidPathError):
             populated_storage.list_directory("file1.txt")
 
+    def test_probe_file(self, populated_storage: StorageService) -> None:
+        """Test probe classifies a file and reports its size."""
+        assert populated_storage.probe("file1.txt") == ("file", 11)
+
+    def test_probe_directory(self, populated_storage: StorageService) -> None:
+        """Test probe classifies a directory."""
+        assert populated_storage.probe("subdir") == ("directory", 0)
+
+    def test_probe_not_found(self, temp_storage: StorageService) -> None:
+        """Test probe raises for non-existent paths."""
+        with pytest.raises(PathNotFoundError):
+            temp_storage.probe("nonexistent.txt")
+
+    def test_probe_invalid_path(self, temp_storage: StorageService) -> None:
+        """Test probe raises for traversal attempts."""
+        with pytest.raises(InvalidPathError):
+            temp_storage.probe("../etc/passwd")
+
+    def test_list_directory_cache_invalidated_on_write(self, temp_storage: StorageService) -> None:
+        """Test that rewriting a file refreshes cached listing sizes."""
+        temp_storage.write_file("file.txt", "12345")
+        assert temp_storage.list_directory("")[0].size == 5
+
+        temp_storage.write_file("file.txt", "larger content!")
+        assert temp_storage.list_directory("")[0].size == 15
+
     def test_read_file_content(self, populated_storage: StorageService) -> None:
         """Test reading file returns content and size."""
         content, size = populated_storage.read_file("file1.txt")
@@ -137,10 +186,10 @@ class TestStorageService:
         assert (tmp_path / "new.txt").read_text() == "New content"
 
     def test_write_file_updates_existing(
-        self, populated_storage: StorageService, tmp_path: Path
+        self, populated_storage_mut: StorageService, tmp_path: Path
     ) -> None:
         """Test writing updates an existing file."""
-        status, size = populated_storage.write_file("file1.txt", "Updated")
+        status, size = populated_storage_mut.write_file("file1.txt", "Updated")
         assert status == "updated"
         assert size == 7
         assert (tmp_path / "file1.txt").read_text() == "Updated"
@@ -160,9 +209,9 @@ class TestStorageService:
         assert size == 0
         assert (tmp_path / "empty.txt").read_text() == ""
 
-    def test_delete_file(self, populated_storage: StorageService, tmp_path: Path) -> None:
+    def test_delete_file(self, populated_storage_mut: StorageService, tmp_path: Path) -> None:
         """Test deleting a file."""
-        file_type = populated_storage.delete("file1.txt")
+        file_type = populated_storage_mut.delete("file1.txt")
         assert file_type == "file"
         assert not (tmp_path / "file1.txt").exists()
 
@@ -209,6 +258,11 @@ class TestStorageService:
 class TestFileInfo:
     """Test cases for FileInfo dataclass."""
 
+    def test_is_slotted(self) -> None:
+        """Lock in the slots optimization: no per-instance __dict__."""
+        assert hasattr(FileInfo, "__slots__")
+        assert "__dict__" not in FileInfo.__slots__
+
     def test_to_dict_file(self) -> None:
         """Test FileInfo serialization for a file."""
         info = FileInfo(name="test.txt", type="file", size=100)